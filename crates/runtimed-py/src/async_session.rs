@@ -17,6 +17,7 @@ use runtimed::protocol::{NotebookBroadcast, NotebookRequest, NotebookResponse};
 
 use crate::error::to_py_err;
 use crate::output::{Cell, ExecutionResult, Output};
+use crate::session::check_distinct_cell_ids;
 
 /// An async session for executing code via the runtimed daemon.
 ///
@@ -142,11 +143,7 @@ impl AsyncSession {
             }
 
             // Check for socket path override via environment variable
-            let socket_path = if let Ok(path) = std::env::var("RUNTIMED_SOCKET_PATH") {
-                std::path::PathBuf::from(path)
-            } else {
-                runtimed::default_socket_path()
-            };
+            let socket_path = crate::client::socket_path();
 
             let (handle, sync_rx, broadcast_rx, _cells, _notebook_path) =
                 NotebookSyncClient::connect_split(socket_path.clone(), notebook_id)
@@ -221,11 +218,7 @@ impl AsyncSession {
                     drop(state_guard);
 
                     // Connect
-                    let socket_path = if let Ok(path) = std::env::var("RUNTIMED_SOCKET_PATH") {
-                        std::path::PathBuf::from(path)
-                    } else {
-                        runtimed::default_socket_path()
-                    };
+                    let socket_path = crate::client::socket_path();
 
                     let (handle, sync_rx, broadcast_rx, _cells, _notebook_path) =
                         NotebookSyncClient::connect_split(socket_path.clone(), notebook_id)
@@ -353,8 +346,10 @@ impl AsyncSession {
                 .as_ref()
                 .ok_or_else(|| to_py_err("Not connected"))?;
 
-            let cells = handle.get_cells().await.map_err(to_py_err)?;
-            let insert_index = index.unwrap_or(cells.len());
+            let insert_index = match index {
+                Some(i) => i,
+                None => handle.cell_count().await.map_err(to_py_err)?,
+            };
 
             handle
                 .add_cell(insert_index, &cell_id, &cell_type)
@@ -372,6 +367,61 @@ impl AsyncSession {
         })
     }
 
+    /// Create several cells in the automerge document with one sync.
+    ///
+    /// Equivalent to calling create_cell() for each source in order, but
+    /// all cells reach the daemon in a single round-trip.
+    ///
+    /// Args:
+    ///     sources: Source code for each new cell.
+    ///     cell_type: Cell type for every new cell (default: "code").
+    ///     index: Position to insert the first cell (default: append at end).
+    ///
+    /// Returns a coroutine that resolves to the new cell IDs (list[str]),
+    /// in document order.
+    #[pyo3(signature = (sources, cell_type="code", index=None))]
+    fn create_cells<'py>(
+        &self,
+        py: Python<'py>,
+        sources: Vec<String>,
+        cell_type: &str,
+        index: Option<usize>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let state = Arc::clone(&self.state);
+        let cells: Vec<(String, String, String)> = sources
+            .into_iter()
+            .map(|source| {
+                (
+                    format!("cell-{}", uuid::Uuid::new_v4()),
+                    cell_type.to_string(),
+                    source,
+                )
+            })
+            .collect();
+
+        future_into_py(py, async move {
+            let cell_ids: Vec<String> = cells.iter().map(|(id, _, _)| id.clone()).collect();
+
+            let state_guard = state.lock().await;
+            let handle = state_guard
+                .handle
+                .as_ref()
+                .ok_or_else(|| to_py_err("Not connected. Call connect() first."))?;
+
+            let insert_index = match index {
+                Some(i) => i,
+                None => handle.cell_count().await.map_err(to_py_err)?,
+            };
+
+            handle
+                .add_cells(insert_index, cells)
+                .await
+                .map_err(to_py_err)?;
+
+            Ok(cell_ids)
+        })
+    }
+
     /// Update a cell's source in the automerge document.
     ///
     /// The change is synced to all connected clients.
@@ -425,10 +475,10 @@ impl AsyncSession {
                 .as_ref()
                 .ok_or_else(|| to_py_err("Not connected"))?;
 
-            let cells = handle.get_cells().await.map_err(to_py_err)?;
-            cells
-                .into_iter()
-                .find(|c| c.id == cell_id)
+            handle
+                .get_cell(&cell_id)
+                .await
+                .map_err(to_py_err)?
                 .map(Cell::from_snapshot)
                 .ok_or_else(|| to_py_err(format!("Cell not found: {}", cell_id)))
         })
@@ -510,105 +560,7 @@ impl AsyncSession {
 
         future_into_py(py, async move {
             // Auto-start kernel if not running
-            {
-                let state_guard = state.lock().await;
-                if !state_guard.kernel_started {
-                    drop(state_guard);
-
-                    // Need to connect and start kernel
-                    let state_guard = state.lock().await;
-                    if state_guard.handle.is_none() {
-                        drop(state_guard);
-
-                        let socket_path = if let Ok(path) = std::env::var("RUNTIMED_SOCKET_PATH") {
-                            std::path::PathBuf::from(path)
-                        } else {
-                            runtimed::default_socket_path()
-                        };
-
-                        let (handle, sync_rx, broadcast_rx, _cells, _notebook_path) =
-                            NotebookSyncClient::connect_split(
-                                socket_path.clone(),
-                                notebook_id.clone(),
-                            )
-                            .await
-                            .map_err(to_py_err)?;
-
-                        let (blob_base_url, blob_store_path) = if let Some(parent) =
-                            socket_path.parent()
-                        {
-                            let daemon_json = parent.join("daemon.json");
-                            let base_url = if daemon_json.exists() {
-                                tokio::fs::read_to_string(&daemon_json)
-                                    .await
-                                    .ok()
-                                    .and_then(|contents| {
-                                        serde_json::from_str::<serde_json::Value>(&contents).ok()
-                                    })
-                                    .and_then(|info| info.get("blob_port").and_then(|p| p.as_u64()))
-                                    .map(|port| format!("http://127.0.0.1:{}", port))
-                            } else {
-                                None
-                            };
-
-                            let store_path = parent.join("blobs");
-                            let store_path = if store_path.exists() {
-                                Some(store_path)
-                            } else {
-                                None
-                            };
-
-                            (base_url, store_path)
-                        } else {
-                            (None, None)
-                        };
-
-                        let mut state_guard = state.lock().await;
-                        state_guard.handle = Some(handle);
-                        state_guard.sync_rx = Some(sync_rx);
-                        state_guard.broadcast_rx = Some(broadcast_rx);
-                        state_guard.blob_base_url = blob_base_url;
-                        state_guard.blob_store_path = blob_store_path;
-                    }
-
-                    // Start kernel
-                    let mut state_guard = state.lock().await;
-                    let handle = state_guard
-                        .handle
-                        .as_ref()
-                        .ok_or_else(|| to_py_err("Not connected"))?;
-
-                    let response = handle
-                        .send_request(NotebookRequest::LaunchKernel {
-                            kernel_type: "python".to_string(),
-                            env_source: "uv:prewarmed".to_string(),
-                            notebook_path: None,
-                        })
-                        .await
-                        .map_err(to_py_err)?;
-
-                    match response {
-                        NotebookResponse::KernelLaunched {
-                            env_source: actual_env,
-                            ..
-                        } => {
-                            state_guard.kernel_started = true;
-                            state_guard.env_source = Some(actual_env);
-                        }
-                        NotebookResponse::KernelAlreadyRunning {
-                            env_source: actual_env,
-                            ..
-                        } => {
-                            state_guard.kernel_started = true;
-                            state_guard.env_source = Some(actual_env);
-                        }
-                        NotebookResponse::Error { error } => return Err(to_py_err(error)),
-                        other => {
-                            return Err(to_py_err(format!("Unexpected response: {:?}", other)))
-                        }
-                    }
-                }
-            }
+            ensure_kernel_started(&state, &notebook_id).await?;
 
             let state_guard = state.lock().await;
 
@@ -655,6 +607,87 @@ impl AsyncSession {
         })
     }
 
+    /// Execute several cells by ID, in order.
+    ///
+    /// All cells are queued with the daemon up front and their outputs are
+    /// collected together, so there is no idle round-trip between cells.
+    /// As with "run all", an error stops execution: cells queued after a
+    /// failing cell are not run, and their results have `success == False`,
+    /// no outputs and no execution count.
+    ///
+    /// Args:
+    ///     cell_ids: The cell IDs to execute.
+    ///     timeout_secs: Maximum time to wait for all cells (default: 60).
+    ///
+    /// Returns a coroutine that resolves to a list of ExecutionResult, in
+    /// the same order as cell_ids.
+    ///
+    /// Raises:
+    ///     RuntimedError: If a cell ID is listed twice, not connected, a cell
+    ///         is not found, or timeout.
+    #[pyo3(signature = (cell_ids, timeout_secs=60.0))]
+    fn execute_cells<'py>(
+        &self,
+        py: Python<'py>,
+        cell_ids: Vec<String>,
+        timeout_secs: f64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        check_distinct_cell_ids(&cell_ids)?;
+
+        let state = Arc::clone(&self.state);
+        let notebook_id = self.notebook_id.clone();
+
+        future_into_py(py, async move {
+            // Auto-start kernel if not running
+            ensure_kernel_started(&state, &notebook_id).await?;
+
+            let state_guard = state.lock().await;
+
+            let handle = state_guard
+                .handle
+                .as_ref()
+                .ok_or_else(|| to_py_err("Not connected"))?;
+
+            let blob_base_url = state_guard.blob_base_url.clone();
+            let blob_store_path = state_guard.blob_store_path.clone();
+
+            // Queue every cell before waiting on any of them
+            for cell_id in &cell_ids {
+                let response = handle
+                    .send_request(NotebookRequest::ExecuteCell {
+                        cell_id: cell_id.clone(),
+                    })
+                    .await
+                    .map_err(to_py_err)?;
+
+                match response {
+                    NotebookResponse::CellQueued { .. } => {}
+                    NotebookResponse::Error { error } => return Err(to_py_err(error)),
+                    other => return Err(to_py_err(format!("Unexpected response: {:?}", other))),
+                }
+            }
+
+            drop(state_guard); // Release lock before waiting for broadcasts
+
+            // Wait for outputs
+            let timeout = std::time::Duration::from_secs_f64(timeout_secs);
+            let result = tokio::time::timeout(
+                timeout,
+                collect_outputs_many_async(&state, &cell_ids, blob_base_url, blob_store_path),
+            )
+            .await;
+
+            match result {
+                Ok(Ok(results)) => Ok(results),
+                Ok(Err(e)) => Err(e),
+                Err(_) => Err(to_py_err(format!(
+                    "Execution timed out after {} seconds",
+                    timeout_secs
+                ))),
+            }
+        })
+    }
+
     /// Convenience method: create a cell, execute it, and return the result.
     ///
     /// This is a shortcut that combines create_cell() and execute_cell().
@@ -691,8 +724,7 @@ impl AsyncSession {
                 let cell_id = format!("cell-{}", uuid::Uuid::new_v4());
 
                 // Get current cell count for append position
-                let cells = handle.get_cells().await.map_err(to_py_err)?;
-                let insert_index = cells.len();
+                let insert_index = handle.cell_count().await.map_err(to_py_err)?;
 
                 // Add cell to document
                 handle
@@ -925,6 +957,102 @@ impl AsyncSession {
 // Helper functions (outside impl block for async use)
 // =========================================================================
 
+/// Connect and launch a uv:prewarmed kernel unless one is already started.
+///
+/// Reuses the daemon's kernel if another client already launched one.
+async fn ensure_kernel_started(
+    state: &Arc<Mutex<AsyncSessionState>>,
+    notebook_id: &str,
+) -> PyResult<()> {
+    let state_guard = state.lock().await;
+    if !state_guard.kernel_started {
+        drop(state_guard);
+
+        // Need to connect and start kernel
+        let state_guard = state.lock().await;
+        if state_guard.handle.is_none() {
+            drop(state_guard);
+
+            let socket_path = crate::client::socket_path();
+
+            let (handle, sync_rx, broadcast_rx, _cells, _notebook_path) =
+                NotebookSyncClient::connect_split(socket_path.clone(), notebook_id.to_string())
+                    .await
+                    .map_err(to_py_err)?;
+
+            let (blob_base_url, blob_store_path) = if let Some(parent) = socket_path.parent() {
+                let daemon_json = parent.join("daemon.json");
+                let base_url = if daemon_json.exists() {
+                    tokio::fs::read_to_string(&daemon_json)
+                        .await
+                        .ok()
+                        .and_then(|contents| {
+                            serde_json::from_str::<serde_json::Value>(&contents).ok()
+                        })
+                        .and_then(|info| info.get("blob_port").and_then(|p| p.as_u64()))
+                        .map(|port| format!("http://127.0.0.1:{}", port))
+                } else {
+                    None
+                };
+
+                let store_path = parent.join("blobs");
+                let store_path = if store_path.exists() {
+                    Some(store_path)
+                } else {
+                    None
+                };
+
+                (base_url, store_path)
+            } else {
+                (None, None)
+            };
+
+            let mut state_guard = state.lock().await;
+            state_guard.handle = Some(handle);
+            state_guard.sync_rx = Some(sync_rx);
+            state_guard.broadcast_rx = Some(broadcast_rx);
+            state_guard.blob_base_url = blob_base_url;
+            state_guard.blob_store_path = blob_store_path;
+        }
+
+        // Start kernel
+        let mut state_guard = state.lock().await;
+        let handle = state_guard
+            .handle
+            .as_ref()
+            .ok_or_else(|| to_py_err("Not connected"))?;
+
+        let response = handle
+            .send_request(NotebookRequest::LaunchKernel {
+                kernel_type: "python".to_string(),
+                env_source: "uv:prewarmed".to_string(),
+                notebook_path: None,
+            })
+            .await
+            .map_err(to_py_err)?;
+
+        match response {
+            NotebookResponse::KernelLaunched {
+                env_source: actual_env,
+                ..
+            } => {
+                state_guard.kernel_started = true;
+                state_guard.env_source = Some(actual_env);
+            }
+            NotebookResponse::KernelAlreadyRunning {
+                env_source: actual_env,
+                ..
+            } => {
+                state_guard.kernel_started = true;
+                state_guard.env_source = Some(actual_env);
+            }
+            NotebookResponse::Error { error } => return Err(to_py_err(error)),
+            other => return Err(to_py_err(format!("Unexpected response: {:?}", other))),
+        }
+    }
+    Ok(())
+}
+
 /// Collect outputs for a cell until ExecutionDone is received.
 async fn collect_outputs_async(
     state: &Arc<Mutex<AsyncSessionState>>,
@@ -932,12 +1060,54 @@ async fn collect_outputs_async(
     blob_base_url: Option<String>,
     blob_store_path: Option<PathBuf>,
 ) -> PyResult<ExecutionResult> {
-    let mut outputs = Vec::new();
-    let mut execution_count = None;
-    let mut success = true;
-    let mut done_received = false;
+    let mut results = collect_outputs_many_async(
+        state,
+        &[cell_id.to_string()],
+        blob_base_url,
+        blob_store_path,
+    )
+    .await?;
+    Ok(results.remove(0))
+}
+
+/// Collect outputs for several queued cells until each one is finished.
+///
+/// A cell is finished when its ExecutionDone arrives, or when it leaves the
+/// daemon's queue without ever executing (stop-on-error and interrupt clear
+/// the queue). Cells that never ran come back with `success == false`, no
+/// outputs and no execution count. Results are in `cell_ids` order.
+async fn collect_outputs_many_async(
+    state: &Arc<Mutex<AsyncSessionState>>,
+    cell_ids: &[String],
+    blob_base_url: Option<String>,
+    blob_store_path: Option<PathBuf>,
+) -> PyResult<Vec<ExecutionResult>> {
+    struct Pending {
+        outputs: Vec<Output>,
+        execution_count: Option<i64>,
+        success: bool,
+        /// Seen in the daemon's queue
+        queued: bool,
+        /// Picked up by the kernel
+        started: bool,
+        done: bool,
+    }
+
+    let mut pending: Vec<Pending> = cell_ids
+        .iter()
+        .map(|_| Pending {
+            outputs: Vec::new(),
+            execution_count: None,
+            success: true,
+            queued: false,
+            started: false,
+            done: false,
+        })
+        .collect();
+    let index_of = |id: &str| cell_ids.iter().position(|c| c == id);
 
     loop {
+        let all_done = pending.iter().all(|p| p.done);
         let mut state_guard = state.lock().await;
 
         let broadcast_rx = state_guard
@@ -945,7 +1115,7 @@ async fn collect_outputs_async(
             .as_mut()
             .ok_or_else(|| to_py_err("Not connected"))?;
 
-        let timeout_ms = if done_received { 50 } else { 100 };
+        let timeout_ms = if all_done { 50 } else { 100 };
         let broadcast = tokio::time::timeout(
             std::time::Duration::from_millis(timeout_ms),
             broadcast_rx.recv(),
@@ -962,8 +1132,9 @@ async fn collect_outputs_async(
                         cell_id: msg_cell_id,
                         execution_count: count,
                     } => {
-                        if msg_cell_id == cell_id {
-                            execution_count = Some(count);
+                        if let Some(i) = index_of(&msg_cell_id) {
+                            pending[i].started = true;
+                            pending[i].execution_count = Some(count);
                         }
                     }
                     NotebookBroadcast::Output {
@@ -971,7 +1142,7 @@ async fn collect_outputs_async(
                         output_type,
                         output_json,
                     } => {
-                        if msg_cell_id == cell_id {
+                        if let Some(i) = index_of(&msg_cell_id) {
                             if let Some(output) = parse_output_async(
                                 &output_type,
                                 &output_json,
@@ -981,26 +1152,46 @@ async fn collect_outputs_async(
                             .await
                             {
                                 if output.output_type == "error" {
-                                    success = false;
+                                    pending[i].success = false;
                                 }
-                                outputs.push(output);
+                                pending[i].outputs.push(output);
                             }
                         }
                     }
                     NotebookBroadcast::ExecutionDone {
                         cell_id: msg_cell_id,
                     } => {
-                        if msg_cell_id == cell_id {
+                        if let Some(i) = index_of(&msg_cell_id) {
                             log::debug!(
-                                "[async_session] ExecutionDone received, starting drain phase"
+                                "[async_session] ExecutionDone received for {}",
+                                msg_cell_id
                             );
-                            done_received = true;
+                            pending[i].done = true;
+                        }
+                    }
+                    NotebookBroadcast::QueueChanged { executing, queued } => {
+                        for (id, p) in cell_ids.iter().zip(pending.iter_mut()) {
+                            if p.done {
+                                continue;
+                            }
+                            if executing.as_deref() == Some(id.as_str()) {
+                                p.started = true;
+                            } else if queued.contains(id) {
+                                p.queued = true;
+                            } else if p.queued && !p.started {
+                                // Dropped from the queue without running
+                                log::debug!("[async_session] Cell {} dropped from queue", id);
+                                p.success = false;
+                                p.done = true;
+                            }
                         }
                     }
                     NotebookBroadcast::KernelError { error } => {
-                        success = false;
-                        outputs.push(Output::error("KernelError", &error, vec![]));
-                        done_received = true;
+                        for p in pending.iter_mut().filter(|p| !p.done) {
+                            p.success = false;
+                            p.outputs.push(Output::error("KernelError", &error, vec![]));
+                            p.done = true;
+                        }
                     }
                     _ => {}
                 }
@@ -1009,23 +1200,24 @@ async fn collect_outputs_async(
                 return Err(to_py_err("Broadcast channel closed"));
             }
             Err(_) => {
-                if done_received {
-                    log::debug!(
-                        "[async_session] Drain timeout, finishing with {} outputs",
-                        outputs.len()
-                    );
+                if all_done {
+                    log::debug!("[async_session] Drain timeout, finishing");
                     break;
                 }
             }
         }
     }
 
-    Ok(ExecutionResult {
-        cell_id: cell_id.to_string(),
-        outputs,
-        success,
-        execution_count,
-    })
+    Ok(cell_ids
+        .iter()
+        .zip(pending)
+        .map(|(cell_id, p)| ExecutionResult {
+            cell_id: cell_id.clone(),
+            outputs: p.outputs,
+            success: p.success,
+            execution_count: p.execution_count,
+        })
+        .collect())
 }
 
 /// Parse an output from the daemon broadcast.
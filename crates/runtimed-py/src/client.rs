@@ -2,12 +2,33 @@
 //!
 //! Provides access to daemon status, pool information, and room listing.
 
+use std::path::PathBuf;
+
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use tokio::runtime::Runtime;
 
 use crate::error::to_py_err;
 
+/// Socket path the bindings connect to.
+///
+/// RUNTIMED_SOCKET_PATH if set, otherwise the daemon's default path.
+pub(crate) fn socket_path() -> PathBuf {
+    match std::env::var("RUNTIMED_SOCKET_PATH") {
+        Ok(path) => PathBuf::from(path),
+        Err(_) => runtimed::default_socket_path(),
+    }
+}
+
+/// Return the socket path that Session, AsyncSession and DaemonClient use.
+///
+/// This is RUNTIMED_SOCKET_PATH if set, otherwise the daemon's default
+/// path (which honors CONDUCTOR_WORKSPACE_PATH in dev mode).
+#[pyfunction]
+pub fn default_socket_path() -> PathBuf {
+    socket_path()
+}
+
 /// Client for communicating with the runtimed daemon.
 ///
 /// Provides synchronous access to daemon operations. Uses an internal
@@ -30,11 +51,12 @@ impl DaemonClient {
     ///
     /// Connects to the daemon at the default socket path, which is
     /// automatically determined based on environment variables
-    /// (CONDUCTOR_WORKSPACE_PATH for dev mode).
+    /// (CONDUCTOR_WORKSPACE_PATH for dev mode). Respects the
+    /// RUNTIMED_SOCKET_PATH environment variable if set, like Session.
     #[new]
     fn new() -> PyResult<Self> {
         let runtime = Runtime::new().map_err(to_py_err)?;
-        let client = runtimed::client::PoolClient::default();
+        let client = runtimed::client::PoolClient::new(socket_path());
         Ok(Self { runtime, client })
     }
 
@@ -16,7 +16,7 @@ mod output;
 mod session;
 
 use async_session::AsyncSession;
-use client::DaemonClient;
+use client::{default_socket_path, DaemonClient};
 use error::RuntimedError;
 use output::{Cell, ExecutionResult, Output};
 use session::Session;
@@ -36,6 +36,9 @@ fn runtimed(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<ExecutionResult>()?;
     m.add_class::<Output>()?;
 
+    // Socket path resolution, shared by every class above
+    m.add_function(wrap_pyfunction!(default_socket_path, m)?)?;
+
     // Error type
     m.add("RuntimedError", m.py().get_type::<RuntimedError>())?;
 
@@ -8,6 +8,7 @@ use std::path::PathBuf;
 use std::sync::Arc;
 use tokio::runtime::Runtime;
 use tokio::sync::Mutex;
+use tokio::task::JoinHandle;
 
 use runtimed::notebook_sync_client::{
     NotebookBroadcastReceiver, NotebookSyncClient, NotebookSyncHandle, NotebookSyncReceiver,
@@ -17,6 +18,11 @@ use runtimed::protocol::{NotebookBroadcast, NotebookRequest, NotebookResponse};
 use crate::error::to_py_err;
 use crate::output::{Cell, ExecutionResult, Output};
 
+/// Kernel type launched by `Session(prewarm=True)`
+const PREWARM_KERNEL_TYPE: &str = "python";
+/// Environment source launched by `Session(prewarm=True)`
+const PREWARM_ENV_SOURCE: &str = "uv:prewarmed";
+
 /// A session for executing code via the runtimed daemon.
 ///
 /// Each session connects to a unique "virtual notebook" room in the daemon
@@ -34,6 +40,8 @@ pub struct Session {
     runtime: Runtime,
     state: Arc<Mutex<SessionState>>,
     notebook_id: String,
+    /// Background connect + kernel launch started by `prewarm=True`
+    prewarm: std::sync::Mutex<Option<JoinHandle<PyResult<()>>>>,
 }
 
 struct SessionState {
@@ -73,17 +81,35 @@ impl Session {
     ///                  If not provided, a random UUID is generated.
     ///                  Multiple Session objects with the same notebook_id
     ///                  will share the same kernel.
+    ///     prewarm: If True, connect and launch the default Python kernel
+    ///              ("uv:prewarmed") in the background right away, so it is
+    ///              often ready by the first execute_cell(). Other calls
+    ///              wait for it as needed. Leave False when the kernel type or
+    ///              environment depends on metadata set after construction:
+    ///              start_kernel() with any other kernel_type or env_source
+    ///              raises instead of reusing the prewarmed kernel.
     #[new]
-    #[pyo3(signature = (notebook_id=None))]
-    fn new(notebook_id: Option<String>) -> PyResult<Self> {
+    #[pyo3(signature = (notebook_id=None, prewarm=false))]
+    fn new(notebook_id: Option<String>, prewarm: bool) -> PyResult<Self> {
         let runtime = Runtime::new().map_err(to_py_err)?;
         let notebook_id =
             notebook_id.unwrap_or_else(|| format!("agent-session-{}", uuid::Uuid::new_v4()));
+        let state = Arc::new(Mutex::new(SessionState::new()));
+
+        let prewarm = prewarm.then(|| {
+            let state = state.clone();
+            let notebook_id = notebook_id.clone();
+            runtime.spawn(async move {
+                connect_state(&state, &notebook_id).await?;
+                launch_kernel(&state, PREWARM_KERNEL_TYPE, PREWARM_ENV_SOURCE, None).await
+            })
+        });
 
         Ok(Self {
             runtime,
-            state: Arc::new(Mutex::new(SessionState::new())),
+            state,
             notebook_id,
+            prewarm: std::sync::Mutex::new(prewarm),
         })
     }
 
@@ -118,63 +144,11 @@ impl Session {
     ///
     /// This is called automatically by start_kernel() if not already connected.
     /// Respects the RUNTIMED_SOCKET_PATH environment variable if set.
-    fn connect(&self) -> PyResult<()> {
-        self.runtime.block_on(async {
-            let mut state = self.state.lock().await;
-            if state.handle.is_some() {
-                return Ok(()); // Already connected
-            }
-
-            // Check for socket path override via environment variable
-            let socket_path = if let Ok(path) = std::env::var("RUNTIMED_SOCKET_PATH") {
-                std::path::PathBuf::from(path)
-            } else {
-                runtimed::default_socket_path()
-            };
-
-            let (handle, sync_rx, broadcast_rx, _cells, _notebook_path) =
-                NotebookSyncClient::connect_split(socket_path.clone(), self.notebook_id.clone())
-                    .await
-                    .map_err(to_py_err)?;
-
-            // Determine blob server URL and blob store path based on socket path
-            // In dev mode, blob server runs on a per-worktree port
-            let (blob_base_url, blob_store_path) = if let Some(parent) = socket_path.parent() {
-                // Read daemon.json to get blob port
-                let daemon_json = parent.join("daemon.json");
-                let base_url = if daemon_json.exists() {
-                    std::fs::read_to_string(&daemon_json)
-                        .ok()
-                        .and_then(|contents| {
-                            serde_json::from_str::<serde_json::Value>(&contents).ok()
-                        })
-                        .and_then(|info| info.get("blob_port").and_then(|p| p.as_u64()))
-                        .map(|port| format!("http://127.0.0.1:{}", port))
-                } else {
-                    None
-                };
-
-                // Blob store is at {daemon_dir}/blobs/
-                let store_path = parent.join("blobs");
-                let store_path = if store_path.exists() {
-                    Some(store_path)
-                } else {
-                    None
-                };
-
-                (base_url, store_path)
-            } else {
-                (None, None)
-            };
-
-            state.handle = Some(handle);
-            state.sync_rx = Some(sync_rx); // Keep alive so sync task doesn't exit
-            state.broadcast_rx = Some(broadcast_rx);
-            state.blob_base_url = blob_base_url;
-            state.blob_store_path = blob_store_path;
-
-            Ok(())
-        })
+    ///
+    /// Releases the GIL while connecting, so sessions can connect
+    /// concurrently from different threads.
+    fn connect(&self, py: Python<'_>) -> PyResult<()> {
+        py.detach(|| self.ensure_connected())
     }
 
     /// Start a kernel for this session.
@@ -189,6 +163,11 @@ impl Session {
     ///
     /// If a kernel is already running for this session's notebook_id,
     /// this returns immediately without starting a new one.
+    ///
+    /// Raises:
+    ///     RuntimedError: If the session was created with prewarm=True and
+    ///         kernel_type or env_source differ from the prewarmed
+    ///         "python" / "uv:prewarmed" kernel.
     #[pyo3(signature = (kernel_type="python", env_source="uv:prewarmed", notebook_path=None))]
     fn start_kernel(
         &self,
@@ -196,47 +175,27 @@ impl Session {
         env_source: &str,
         notebook_path: Option<&str>,
     ) -> PyResult<()> {
-        // Ensure connected first
-        self.connect()?;
-
-        self.runtime.block_on(async {
-            let mut state = self.state.lock().await;
-
-            let handle = state
-                .handle
-                .as_ref()
-                .ok_or_else(|| to_py_err("Not connected"))?;
-
-            let response = handle
-                .send_request(NotebookRequest::LaunchKernel {
-                    kernel_type: kernel_type.to_string(),
-                    env_source: env_source.to_string(),
-                    notebook_path: notebook_path.map(|p| p.to_string()),
-                })
-                .await
-                .map_err(to_py_err)?;
+        // A prewarm launch would otherwise race this one, and whichever
+        // reached the daemon first would decide the kernel
+        if self.wait_for_prewarm()
+            && (kernel_type != PREWARM_KERNEL_TYPE || env_source != PREWARM_ENV_SOURCE)
+        {
+            return Err(to_py_err(format!(
+                "Session was created with prewarm=True and already runs a {} ({}) kernel; \
+                 call shutdown_kernel() first to start a {} ({}) kernel",
+                PREWARM_KERNEL_TYPE, PREWARM_ENV_SOURCE, kernel_type, env_source
+            )));
+        }
 
-            match response {
-                NotebookResponse::KernelLaunched {
-                    env_source: actual_env,
-                    ..
-                } => {
-                    state.kernel_started = true;
-                    state.env_source = Some(actual_env);
-                    Ok(())
-                }
-                NotebookResponse::KernelAlreadyRunning {
-                    env_source: actual_env,
-                    ..
-                } => {
-                    state.kernel_started = true;
-                    state.env_source = Some(actual_env);
-                    Ok(())
-                }
-                NotebookResponse::Error { error } => Err(to_py_err(error)),
-                other => Err(to_py_err(format!("Unexpected response: {:?}", other))),
-            }
-        })
+        // Ensure connected first
+        self.ensure_connected()?;
+
+        self.runtime.block_on(launch_kernel(
+            &self.state,
+            kernel_type,
+            env_source,
+            notebook_path,
+        ))
     }
 
     // =========================================================================
@@ -257,7 +216,7 @@ impl Session {
     ///     The cell ID (str).
     #[pyo3(signature = (source="", cell_type="code", index=None))]
     fn create_cell(&self, source: &str, cell_type: &str, index: Option<usize>) -> PyResult<String> {
-        self.connect()?;
+        self.ensure_connected()?;
 
         let cell_id = format!("cell-{}", uuid::Uuid::new_v4());
 
@@ -269,8 +228,10 @@ impl Session {
                 .ok_or_else(|| to_py_err("Not connected"))?;
 
             // Get current cell count to determine index
-            let cells = handle.get_cells().await.map_err(to_py_err)?;
-            let insert_index = index.unwrap_or(cells.len());
+            let insert_index = match index {
+                Some(i) => i,
+                None => handle.cell_count().await.map_err(to_py_err)?,
+            };
 
             // Add cell to document
             handle
@@ -290,6 +251,60 @@ impl Session {
         })
     }
 
+    /// Create several cells in the automerge document with one sync.
+    ///
+    /// Equivalent to calling create_cell() for each source in order, but
+    /// all cells reach the daemon in a single round-trip.
+    ///
+    /// Args:
+    ///     sources: Source code for each new cell.
+    ///     cell_type: Cell type for every new cell (default: "code").
+    ///     index: Position to insert the first cell (default: append at end).
+    ///
+    /// Returns:
+    ///     The new cell IDs (list[str]), in document order.
+    #[pyo3(signature = (sources, cell_type="code", index=None))]
+    fn create_cells(
+        &self,
+        sources: Vec<String>,
+        cell_type: &str,
+        index: Option<usize>,
+    ) -> PyResult<Vec<String>> {
+        self.ensure_connected()?;
+
+        let cells: Vec<(String, String, String)> = sources
+            .into_iter()
+            .map(|source| {
+                (
+                    format!("cell-{}", uuid::Uuid::new_v4()),
+                    cell_type.to_string(),
+                    source,
+                )
+            })
+            .collect();
+        let cell_ids: Vec<String> = cells.iter().map(|(id, _, _)| id.clone()).collect();
+
+        self.runtime.block_on(async {
+            let state = self.state.lock().await;
+            let handle = state
+                .handle
+                .as_ref()
+                .ok_or_else(|| to_py_err("Not connected"))?;
+
+            let insert_index = match index {
+                Some(i) => i,
+                None => handle.cell_count().await.map_err(to_py_err)?,
+            };
+
+            handle
+                .add_cells(insert_index, cells)
+                .await
+                .map_err(to_py_err)?;
+
+            Ok(cell_ids)
+        })
+    }
+
     /// Update a cell's source in the automerge document.
     ///
     /// The change is synced to all connected clients.
@@ -330,10 +345,10 @@ impl Session {
                 .as_ref()
                 .ok_or_else(|| to_py_err("Not connected"))?;
 
-            let cells = handle.get_cells().await.map_err(to_py_err)?;
-            cells
-                .into_iter()
-                .find(|c| c.id == cell_id)
+            handle
+                .get_cell(&cell_id)
+                .await
+                .map_err(to_py_err)?
                 .map(Cell::from_snapshot)
                 .ok_or_else(|| to_py_err(format!("Cell not found: {}", cell_id)))
         })
@@ -386,7 +401,7 @@ impl Session {
     ///     key: The metadata key.
     ///     value: The metadata value (typically JSON).
     fn set_metadata(&self, key: &str, value: &str) -> PyResult<()> {
-        self.connect()?;
+        self.ensure_connected()?;
 
         let key = key.to_string();
         let value = value.to_string();
@@ -402,6 +417,29 @@ impl Session {
         })
     }
 
+    /// Set several metadata values in the automerge document at once.
+    ///
+    /// Like calling set_metadata() for each item, but all values reach the
+    /// daemon and other clients in a single sync message.
+    ///
+    /// Args:
+    ///     items: Mapping of metadata key to value (typically JSON).
+    fn set_metadata_batch(&self, items: HashMap<String, String>) -> PyResult<()> {
+        self.ensure_connected()?;
+
+        let items: Vec<(String, String)> = items.into_iter().collect();
+
+        self.runtime.block_on(async {
+            let state = self.state.lock().await;
+            let handle = state
+                .handle
+                .as_ref()
+                .ok_or_else(|| to_py_err("Not connected"))?;
+
+            handle.set_metadata_batch(items).await.map_err(to_py_err)
+        })
+    }
+
     /// Get a metadata value from the automerge document.
     ///
     /// Reads from the local replica of the automerge doc.
@@ -412,7 +450,7 @@ impl Session {
     /// Returns:
     ///     The metadata value (str) or None if not set.
     fn get_metadata(&self, key: &str) -> PyResult<Option<String>> {
-        self.connect()?;
+        self.ensure_connected()?;
 
         let key = key.to_string();
 
@@ -454,6 +492,7 @@ impl Session {
         let cell_id = cell_id.to_string();
 
         // Auto-start kernel if not running (will reuse existing kernel if one is running)
+        self.wait_for_prewarm();
         {
             let state = self.runtime.block_on(self.state.lock());
             if !state.kernel_started {
@@ -508,6 +547,90 @@ impl Session {
         })
     }
 
+    /// Execute several cells by ID, in order.
+    ///
+    /// All cells are queued with the daemon up front and their outputs are
+    /// collected together, so there is no idle round-trip between cells.
+    /// As with "run all", an error stops execution: cells queued after a
+    /// failing cell are not run, and their results have `success == False`,
+    /// no outputs and no execution count.
+    ///
+    /// Args:
+    ///     cell_ids: The cell IDs to execute.
+    ///     timeout_secs: Maximum time to wait for all cells (default: 60).
+    ///
+    /// Returns:
+    ///     A list of ExecutionResult, in the same order as cell_ids.
+    ///
+    /// Raises:
+    ///     RuntimedError: If a cell ID is listed twice, not connected, a cell
+    ///         is not found, or timeout.
+    #[pyo3(signature = (cell_ids, timeout_secs=60.0))]
+    fn execute_cells(
+        &self,
+        cell_ids: Vec<String>,
+        timeout_secs: f64,
+    ) -> PyResult<Vec<ExecutionResult>> {
+        check_distinct_cell_ids(&cell_ids)?;
+
+        // Auto-start kernel if not running (will reuse existing kernel if one is running)
+        self.wait_for_prewarm();
+        {
+            let state = self.runtime.block_on(self.state.lock());
+            if !state.kernel_started {
+                drop(state);
+                self.start_kernel("python", "uv:prewarmed", None)?;
+            }
+        }
+
+        self.runtime.block_on(async {
+            let state = self.state.lock().await;
+
+            let handle = state
+                .handle
+                .as_ref()
+                .ok_or_else(|| to_py_err("Not connected"))?;
+
+            let blob_base_url = state.blob_base_url.clone();
+            let blob_store_path = state.blob_store_path.clone();
+
+            // Queue every cell before waiting on any of them
+            for cell_id in &cell_ids {
+                let response = handle
+                    .send_request(NotebookRequest::ExecuteCell {
+                        cell_id: cell_id.clone(),
+                    })
+                    .await
+                    .map_err(to_py_err)?;
+
+                match response {
+                    NotebookResponse::CellQueued { .. } => {}
+                    NotebookResponse::Error { error } => return Err(to_py_err(error)),
+                    other => return Err(to_py_err(format!("Unexpected response: {:?}", other))),
+                }
+            }
+
+            drop(state); // Release lock before waiting for broadcasts
+
+            // Wait for outputs
+            let timeout = std::time::Duration::from_secs_f64(timeout_secs);
+            let result = tokio::time::timeout(
+                timeout,
+                self.collect_outputs_many(&cell_ids, blob_base_url, blob_store_path),
+            )
+            .await;
+
+            match result {
+                Ok(Ok(results)) => Ok(results),
+                Ok(Err(e)) => Err(e),
+                Err(_) => Err(to_py_err(format!(
+                    "Execution timed out after {} seconds",
+                    timeout_secs
+                ))),
+            }
+        })
+    }
+
     /// Convenience method: create a cell, execute it, and return the result.
     ///
     /// This is a shortcut that combines create_cell() and execute_cell().
@@ -593,6 +716,9 @@ impl Session {
 
     /// Shutdown the kernel.
     fn shutdown_kernel(&self) -> PyResult<()> {
+        // Don't let a pending prewarm launch a kernel after we shut it down
+        self.wait_for_prewarm();
+
         self.runtime.block_on(async {
             let mut state = self.state.lock().await;
 
@@ -647,6 +773,7 @@ impl Session {
         _exc_tb: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<bool> {
         // Shutdown kernel on exit if running
+        self.wait_for_prewarm();
         let state = self.runtime.block_on(self.state.lock());
         if state.kernel_started {
             drop(state);
@@ -660,6 +787,7 @@ impl Session {
     /// This is equivalent to using the session as a context manager
     /// and exiting the context.
     fn close(&self) -> PyResult<()> {
+        self.wait_for_prewarm();
         let state = self.runtime.block_on(self.state.lock());
         if state.kernel_started {
             drop(state);
@@ -670,6 +798,24 @@ impl Session {
 }
 
 impl Session {
+    /// Connect to the daemon if not already connected.
+    fn ensure_connected(&self) -> PyResult<()> {
+        self.runtime.block_on(connect_state(&self.state, &self.notebook_id))
+    }
+
+    /// Wait for a background prewarm (see `Session(prewarm=True)`) to settle.
+    ///
+    /// Returns true if a pending prewarm just launched its kernel. A failed
+    /// prewarm is otherwise ignored: the caller's own connect or launch
+    /// reports the error.
+    fn wait_for_prewarm(&self) -> bool {
+        let task = self.prewarm.lock().unwrap().take();
+        match task {
+            Some(task) => matches!(self.runtime.block_on(task), Ok(Ok(()))),
+            None => false,
+        }
+    }
+
     /// Collect outputs for a cell until ExecutionDone is received.
     ///
     /// Note: Due to the Jupyter shell/iopub race condition, error outputs
@@ -681,12 +827,53 @@ impl Session {
         blob_base_url: Option<String>,
         blob_store_path: Option<PathBuf>,
     ) -> PyResult<ExecutionResult> {
-        let mut outputs = Vec::new();
-        let mut execution_count = None;
-        let mut success = true;
-        let mut done_received = false;
+        let mut results = self
+            .collect_outputs_many(&[cell_id.to_string()], blob_base_url, blob_store_path)
+            .await?;
+        Ok(results.remove(0))
+    }
+
+    /// Collect outputs for several queued cells until each one is finished.
+    ///
+    /// A cell is finished when its ExecutionDone arrives, or when it leaves
+    /// the daemon's queue without ever executing (stop-on-error and interrupt
+    /// clear the queue). Cells that never ran come back with
+    /// `success == false`, no outputs and no execution count.
+    ///
+    /// Like collect_outputs(), keeps draining briefly once every cell is
+    /// finished to catch straggling outputs. Results are in `cell_ids` order.
+    async fn collect_outputs_many(
+        &self,
+        cell_ids: &[String],
+        blob_base_url: Option<String>,
+        blob_store_path: Option<PathBuf>,
+    ) -> PyResult<Vec<ExecutionResult>> {
+        struct Pending {
+            outputs: Vec<Output>,
+            execution_count: Option<i64>,
+            success: bool,
+            /// Seen in the daemon's queue
+            queued: bool,
+            /// Picked up by the kernel
+            started: bool,
+            done: bool,
+        }
+
+        let mut pending: Vec<Pending> = cell_ids
+            .iter()
+            .map(|_| Pending {
+                outputs: Vec::new(),
+                execution_count: None,
+                success: true,
+                queued: false,
+                started: false,
+                done: false,
+            })
+            .collect();
+        let index_of = |id: &str| cell_ids.iter().position(|c| c == id);
 
         loop {
+            let all_done = pending.iter().all(|p| p.done);
             let mut state = self.state.lock().await;
 
             let broadcast_rx = state
@@ -695,7 +882,7 @@ impl Session {
                 .ok_or_else(|| to_py_err("Not connected"))?;
 
             // Use a short timeout - shorter after done to drain quickly
-            let timeout_ms = if done_received { 50 } else { 100 };
+            let timeout_ms = if all_done { 50 } else { 100 };
             let broadcast = tokio::time::timeout(
                 std::time::Duration::from_millis(timeout_ms),
                 broadcast_rx.recv(),
@@ -712,8 +899,9 @@ impl Session {
                             cell_id: msg_cell_id,
                             execution_count: count,
                         } => {
-                            if msg_cell_id == cell_id {
-                                execution_count = Some(count);
+                            if let Some(i) = index_of(&msg_cell_id) {
+                                pending[i].started = true;
+                                pending[i].execution_count = Some(count);
                             }
                         }
                         NotebookBroadcast::Output {
@@ -726,7 +914,7 @@ impl Session {
                                 output_type,
                                 msg_cell_id
                             );
-                            if msg_cell_id == cell_id {
+                            if let Some(i) = index_of(&msg_cell_id) {
                                 if let Some(output) = self
                                     .parse_output(
                                         &output_type,
@@ -741,9 +929,9 @@ impl Session {
                                         output.output_type
                                     );
                                     if output.output_type == "error" {
-                                        success = false;
+                                        pending[i].success = false;
                                     }
-                                    outputs.push(output);
+                                    pending[i].outputs.push(output);
                                 } else {
                                     log::debug!("[session] Failed to parse output");
                                 }
@@ -752,22 +940,42 @@ impl Session {
                         NotebookBroadcast::ExecutionDone {
                             cell_id: msg_cell_id,
                         } => {
-                            if msg_cell_id == cell_id {
-                                // Don't break immediately - drain for a bit to catch
+                            if let Some(i) = index_of(&msg_cell_id) {
+                                // Don't stop immediately - drain for a bit to catch
                                 // straggling outputs due to shell/iopub race condition
                                 log::debug!(
-                                    "[session] ExecutionDone received, starting drain phase"
+                                    "[session] ExecutionDone received for {}",
+                                    msg_cell_id
                                 );
-                                done_received = true;
+                                pending[i].done = true;
+                            }
+                        }
+                        NotebookBroadcast::QueueChanged { executing, queued } => {
+                            for (id, p) in cell_ids.iter().zip(pending.iter_mut()) {
+                                if p.done {
+                                    continue;
+                                }
+                                if executing.as_deref() == Some(id.as_str()) {
+                                    p.started = true;
+                                } else if queued.contains(id) {
+                                    p.queued = true;
+                                } else if p.queued && !p.started {
+                                    // Dropped from the queue without running
+                                    log::debug!("[session] Cell {} dropped from queue", id);
+                                    p.success = false;
+                                    p.done = true;
+                                }
                             }
                         }
                         NotebookBroadcast::KernelError { error } => {
-                            success = false;
-                            outputs.push(Output::error("KernelError", &error, vec![]));
-                            done_received = true;
+                            for p in pending.iter_mut().filter(|p| !p.done) {
+                                p.success = false;
+                                p.outputs.push(Output::error("KernelError", &error, vec![]));
+                                p.done = true;
+                            }
                         }
                         _ => {
-                            // Ignore other broadcasts (KernelStatus, QueueChanged, etc.)
+                            // Ignore other broadcasts (KernelStatus, etc.)
                         }
                     }
                 }
@@ -776,12 +984,9 @@ impl Session {
                     return Err(to_py_err("Broadcast channel closed"));
                 }
                 Err(_) => {
-                    // Timeout - if we've seen ExecutionDone, we're done draining
-                    if done_received {
-                        log::debug!(
-                            "[session] Drain timeout, finishing with {} outputs",
-                            outputs.len()
-                        );
+                    // Timeout - if every cell is finished, we're done draining
+                    if all_done {
+                        log::debug!("[session] Drain timeout, finishing");
                         break;
                     }
                     // Otherwise continue waiting
@@ -789,12 +994,16 @@ impl Session {
             }
         }
 
-        Ok(ExecutionResult {
-            cell_id: cell_id.to_string(),
-            outputs,
-            success,
-            execution_count,
-        })
+        Ok(cell_ids
+            .iter()
+            .zip(pending)
+            .map(|(cell_id, p)| ExecutionResult {
+                cell_id: cell_id.clone(),
+                outputs: p.outputs,
+                success: p.success,
+                execution_count: p.execution_count,
+            })
+            .collect())
     }
 
     /// Parse an output from the daemon broadcast.
@@ -1029,3 +1238,121 @@ impl Session {
         None
     }
 }
+
+/// Connect `state` to the daemon if it isn't already connected.
+///
+/// Respects the RUNTIMED_SOCKET_PATH environment variable if set.
+async fn connect_state(state: &Mutex<SessionState>, notebook_id: &str) -> PyResult<()> {
+    let mut state = state.lock().await;
+    if state.handle.is_some() {
+        return Ok(()); // Already connected
+    }
+
+    // Check for socket path override via environment variable
+    let socket_path = crate::client::socket_path();
+
+    let (handle, sync_rx, broadcast_rx, _cells, _notebook_path) =
+        NotebookSyncClient::connect_split(socket_path.clone(), notebook_id.to_string())
+            .await
+            .map_err(to_py_err)?;
+
+    // Determine blob server URL and blob store path based on socket path
+    // In dev mode, blob server runs on a per-worktree port
+    let (blob_base_url, blob_store_path) = if let Some(parent) = socket_path.parent() {
+        // Read daemon.json to get blob port
+        let daemon_json = parent.join("daemon.json");
+        let base_url = if daemon_json.exists() {
+            std::fs::read_to_string(&daemon_json)
+                .ok()
+                .and_then(|contents| serde_json::from_str::<serde_json::Value>(&contents).ok())
+                .and_then(|info| info.get("blob_port").and_then(|p| p.as_u64()))
+                .map(|port| format!("http://127.0.0.1:{}", port))
+        } else {
+            None
+        };
+
+        // Blob store is at {daemon_dir}/blobs/
+        let store_path = parent.join("blobs");
+        let store_path = if store_path.exists() {
+            Some(store_path)
+        } else {
+            None
+        };
+
+        (base_url, store_path)
+    } else {
+        (None, None)
+    };
+
+    state.handle = Some(handle);
+    state.sync_rx = Some(sync_rx); // Keep alive so sync task doesn't exit
+    state.broadcast_rx = Some(broadcast_rx);
+    state.blob_base_url = blob_base_url;
+    state.blob_store_path = blob_store_path;
+
+    Ok(())
+}
+
+/// Reject a cell ID listed more than once in a batch execution.
+///
+/// Outputs are matched back to their slot by cell ID, so a repeated ID would
+/// leave its second slot waiting until the timeout.
+pub(crate) fn check_distinct_cell_ids(cell_ids: &[String]) -> PyResult<()> {
+    let mut seen = std::collections::HashSet::new();
+    match cell_ids.iter().find(|id| !seen.insert(id.as_str())) {
+        Some(id) => Err(to_py_err(format!(
+            "Cell {} is listed more than once; execute it in a separate call",
+            id
+        ))),
+        None => Ok(()),
+    }
+}
+
+/// Ask the daemon to launch (or reuse) the notebook's kernel and record it
+/// in `state`.
+async fn launch_kernel(
+    state: &Mutex<SessionState>,
+    kernel_type: &str,
+    env_source: &str,
+    notebook_path: Option<&str>,
+) -> PyResult<()> {
+    // The daemon only replies once the kernel is up, so don't hold the state
+    // lock across the request: doc operations keep going during the launch
+    let handle = state
+        .lock()
+        .await
+        .handle
+        .clone()
+        .ok_or_else(|| to_py_err("Not connected"))?;
+
+    let response = handle
+        .send_request(NotebookRequest::LaunchKernel {
+            kernel_type: kernel_type.to_string(),
+            env_source: env_source.to_string(),
+            notebook_path: notebook_path.map(|p| p.to_string()),
+        })
+        .await
+        .map_err(to_py_err)?;
+
+    let mut state = state.lock().await;
+    match response {
+        NotebookResponse::KernelLaunched {
+            env_source: actual_env,
+            ..
+        } => {
+            state.kernel_started = true;
+            state.env_source = Some(actual_env);
+            Ok(())
+        }
+        NotebookResponse::KernelAlreadyRunning {
+            env_source: actual_env,
+            ..
+        } => {
+            state.kernel_started = true;
+            state.env_source = Some(actual_env);
+            Ok(())
+        }
+        NotebookResponse::Error { error } => Err(to_py_err(error)),
+        other => Err(to_py_err(format!("Unexpected response: {:?}", other))),
+    }
+}
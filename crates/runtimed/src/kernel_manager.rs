@@ -28,7 +28,7 @@ use uuid::Uuid;
 use crate::blob_store::BlobStore;
 use crate::comm_state::CommState;
 use crate::notebook_doc::NotebookDoc;
-use crate::notebook_sync_server::persist_notebook_bytes;
+use crate::notebook_sync_server::NotebookPersister;
 use crate::output_store::{self, DEFAULT_INLINE_THRESHOLD};
 use crate::protocol::{CompletionItem, HistoryEntry, NotebookBroadcast};
 use crate::stream_terminal::{StreamOutputState, StreamTerminals};
@@ -320,8 +320,8 @@ pub struct RoomKernel {
     cmd_rx: Option<mpsc::Receiver<QueueCommand>>,
     /// Automerge document for persisting outputs
     doc: Arc<RwLock<NotebookDoc>>,
-    /// Path for persisting the document
-    persist_path: PathBuf,
+    /// Writes the document to disk outside the doc lock
+    persister: NotebookPersister,
     /// Channel to notify peers of document changes
     changed_tx: broadcast::Sender<()>,
     /// Blob store for output manifests
@@ -362,7 +362,7 @@ impl RoomKernel {
     pub fn new(
         broadcast_tx: broadcast::Sender<NotebookBroadcast>,
         doc: Arc<RwLock<NotebookDoc>>,
-        persist_path: PathBuf,
+        persister: NotebookPersister,
         changed_tx: broadcast::Sender<()>,
         blob_store: Arc<BlobStore>,
         comm_state: Arc<CommState>,
@@ -388,7 +388,7 @@ impl RoomKernel {
             cmd_tx: None,
             cmd_rx: None,
             doc,
-            persist_path,
+            persister,
             changed_tx,
             blob_store,
             comm_state,
@@ -707,7 +707,7 @@ impl RoomKernel {
         let cell_id_map = self.cell_id_map.clone();
         let iopub_cmd_tx = cmd_tx.clone();
         let doc = self.doc.clone();
-        let persist_path = self.persist_path.clone();
+        let persister = self.persister.clone();
         let changed_tx = self.changed_tx.clone();
         let blob_store = self.blob_store.clone();
         let comm_state = self.comm_state.clone();
@@ -866,7 +866,7 @@ impl RoomKernel {
                                     };
 
                                     // Upsert stream output (update if validated, append if not)
-                                    let persist_bytes = {
+                                    {
                                         let mut doc_guard = doc.write().await;
                                         match doc_guard.upsert_stream_output(
                                             cid,
@@ -893,11 +893,9 @@ impl RoomKernel {
                                                 );
                                             }
                                         }
-                                        let bytes = doc_guard.save();
+                                        persister.persist(&mut doc_guard);
                                         let _ = changed_tx.send(());
-                                        bytes
-                                    };
-                                    persist_notebook_bytes(&persist_bytes, &persist_path);
+                                    }
 
                                     let _ = broadcast_tx.send(NotebookBroadcast::Output {
                                         cell_id: cid.clone(),
@@ -997,7 +995,7 @@ impl RoomKernel {
                                         };
 
                                         // Append hash (or fallback JSON) to Automerge doc
-                                        let persist_bytes = {
+                                        {
                                             let mut doc_guard = doc.write().await;
                                             if let Err(e) =
                                                 doc_guard.append_output(cid, &output_ref)
@@ -1007,11 +1005,9 @@ impl RoomKernel {
                                                     e
                                                 );
                                             }
-                                            let bytes = doc_guard.save();
+                                            persister.persist(&mut doc_guard);
                                             let _ = changed_tx.send(());
-                                            bytes
-                                        };
-                                        persist_notebook_bytes(&persist_bytes, &persist_path);
+                                        }
 
                                         let _ = broadcast_tx.send(NotebookBroadcast::Output {
                                             cell_id: cid.clone(),
@@ -1027,7 +1023,7 @@ impl RoomKernel {
                             // Supports both manifest hashes and raw JSON (backward compatibility).
                             JupyterMessageContent::UpdateDisplayData(update) => {
                                 if let Some(ref display_id) = update.transient.display_id {
-                                    let persist_bytes = {
+                                    {
                                         let mut doc_guard = doc.write().await;
                                         match update_output_by_display_id_with_manifests(
                                             &mut doc_guard,
@@ -1057,11 +1053,9 @@ impl RoomKernel {
                                                 );
                                             }
                                         }
-                                        let bytes = doc_guard.save();
+                                        persister.persist(&mut doc_guard);
                                         let _ = changed_tx.send(());
-                                        bytes
-                                    };
-                                    persist_notebook_bytes(&persist_bytes, &persist_path);
+                                    }
 
                                     // Broadcast for immediate UI update
                                     // Frontend will receive via Automerge sync, but broadcast for speed
@@ -1153,7 +1147,7 @@ impl RoomKernel {
                                         };
 
                                         // Write error output to Automerge doc before broadcasting
-                                        let persist_bytes = {
+                                        {
                                             let mut doc_guard = doc.write().await;
                                             if let Err(e) =
                                                 doc_guard.append_output(cid, &output_ref)
@@ -1163,11 +1157,9 @@ impl RoomKernel {
                                                     e
                                                 );
                                             }
-                                            let bytes = doc_guard.save();
+                                            persister.persist(&mut doc_guard);
                                             let _ = changed_tx.send(());
-                                            bytes
-                                        };
-                                        persist_notebook_bytes(&persist_bytes, &persist_path);
+                                        }
 
                                         let _ = broadcast_tx.send(NotebookBroadcast::Output {
                                             cell_id: cid.clone(),
@@ -1351,7 +1343,7 @@ impl RoomKernel {
         // Additional resources for handling page payloads (IPython ? and ?? help)
         let shell_doc = self.doc.clone();
         let shell_blob_store = self.blob_store.clone();
-        let shell_persist_path = self.persist_path.clone();
+        let shell_persister = self.persister.clone();
         let shell_changed_tx = self.changed_tx.clone();
 
         let shell_reader_task = tokio::spawn(async move {
@@ -1412,7 +1404,7 @@ impl RoomKernel {
                                             };
 
                                             // Append to Automerge doc
-                                            let persist_bytes = {
+                                            {
                                                 let mut doc_guard = shell_doc.write().await;
                                                 if let Err(e) =
                                                     doc_guard.append_output(cid, &output_ref)
@@ -1422,14 +1414,9 @@ impl RoomKernel {
                                                         e
                                                     );
                                                 }
-                                                let bytes = doc_guard.save();
+                                                shell_persister.persist(&mut doc_guard);
                                                 let _ = shell_changed_tx.send(());
-                                                bytes
-                                            };
-                                            persist_notebook_bytes(
-                                                &persist_bytes,
-                                                &shell_persist_path,
-                                            );
+                                            }
 
                                             // Broadcast to all windows
                                             let _ = shell_broadcast_tx.send(
@@ -2049,10 +2036,10 @@ mod tests {
         let (tx, _rx) = broadcast::channel(16);
         let (changed_tx, _changed_rx) = broadcast::channel(16);
         let doc = Arc::new(RwLock::new(NotebookDoc::new("test-notebook")));
-        let persist_path = PathBuf::from("/tmp/test.automerge");
+        let persister = NotebookPersister::spawn(tmp.path().join("test.automerge"));
         let blob_store = Arc::new(BlobStore::new(tmp.path().join("blobs")));
         let comm_state = Arc::new(CommState::new());
-        let kernel = RoomKernel::new(tx, doc, persist_path, changed_tx, blob_store, comm_state);
+        let kernel = RoomKernel::new(tx, doc, persister, changed_tx, blob_store, comm_state);
 
         assert!(!kernel.is_running());
         assert!(kernel.executing_cell().is_none());
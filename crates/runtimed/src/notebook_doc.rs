@@ -47,12 +47,51 @@ pub struct CellSnapshot {
     pub outputs: Vec<String>,
 }
 
+/// Bytes for one step of persisting a `NotebookDoc`, from `take_persist_chunk`.
+#[derive(Debug)]
+pub enum PersistChunk {
+    /// A compacted snapshot that replaces the whole file.
+    Snapshot(Vec<u8>),
+    /// Incremental changes to append after the snapshot.
+    Append(Vec<u8>),
+}
+
+impl PersistChunk {
+    /// Write the chunk to `path`.
+    ///
+    /// A failed append can leave a torn tail, which only a later snapshot repairs.
+    pub fn write_to(&self, path: &Path) -> std::io::Result<()> {
+        match self {
+            Self::Snapshot(data) => {
+                if let Some(parent) = path.parent() {
+                    std::fs::create_dir_all(parent)?;
+                }
+                std::fs::write(path, data)
+            }
+            Self::Append(data) => append_to_file(path, data),
+        }
+    }
+}
+
 /// Wrapper around an Automerge document storing a notebook.
 pub struct NotebookDoc {
     doc: AutoCommit,
+    /// Length of the snapshot at the start of the persisted file, or 0 when
+    /// the next `take_persist_chunk` must return a fresh snapshot.
+    persisted_snapshot_len: usize,
+    /// Bytes of incremental change chunks appended after the snapshot.
+    persisted_log_len: usize,
 }
 
 impl NotebookDoc {
+    fn from_doc(doc: AutoCommit) -> Self {
+        Self {
+            doc,
+            persisted_snapshot_len: 0,
+            persisted_log_len: 0,
+        }
+    }
+
     /// Create a new empty notebook document with the given ID.
     pub fn new(notebook_id: &str) -> Self {
         let mut doc = AutoCommit::new();
@@ -67,13 +106,13 @@ impl NotebookDoc {
             let _ = doc.put(&meta_id, "runtime", "python");
         }
 
-        Self { doc }
+        Self::from_doc(doc)
     }
 
     /// Load a notebook document from saved bytes.
     pub fn load(data: &[u8]) -> Result<Self, AutomergeError> {
         let doc = AutoCommit::load(data)?;
-        Ok(Self { doc })
+        Ok(Self::from_doc(doc))
     }
 
     /// Load from file or create a new document if the file doesn't exist.
@@ -87,7 +126,7 @@ impl NotebookDoc {
                 Ok(data) => match AutoCommit::load(&data) {
                     Ok(doc) => {
                         info!("[notebook-doc] Loaded from {:?} for {}", path, notebook_id);
-                        return Self { doc };
+                        return Self::from_doc(doc);
                     }
                     Err(e) => {
                         warn!(
@@ -134,9 +173,67 @@ impl NotebookDoc {
 
     /// Serialize the document to bytes.
     pub fn save(&mut self) -> Vec<u8> {
+        // save() moves Automerge's incremental cursor, so chunks appended by
+        // persist_to_file afterwards would miss these changes. Force the next
+        // persist to start from a fresh snapshot instead.
+        self.persisted_snapshot_len = 0;
         self.doc.save()
     }
 
+    /// Take the bytes that bring the persisted file up to date, or `None` if
+    /// nothing changed since the previous call.
+    ///
+    /// The file is a compacted snapshot followed by an append-only log of
+    /// incremental change chunks. The Automerge format is self-delimiting, so
+    /// `load` reads the snapshot and every appended chunk back in one pass.
+    /// This returns a fresh snapshot on the first call, after `save()` or
+    /// `invalidate_persisted()`, and whenever the log would grow past the
+    /// snapshot; otherwise only the changes since the previous call.
+    ///
+    /// Only serializes, so it can run under the doc lock while the caller does
+    /// the file I/O later. Chunks must be written in the order they were taken.
+    pub fn take_persist_chunk(&mut self) -> Option<PersistChunk> {
+        if self.persisted_snapshot_len > 0 {
+            let chunk = self.doc.save_incremental();
+            if chunk.is_empty() {
+                return None;
+            }
+            if self.persisted_log_len + chunk.len() <= self.persisted_snapshot_len {
+                self.persisted_log_len += chunk.len();
+                return Some(PersistChunk::Append(chunk));
+            }
+        }
+
+        let data = self.save();
+        self.persisted_snapshot_len = data.len();
+        self.persisted_log_len = 0;
+        Some(PersistChunk::Snapshot(data))
+    }
+
+    /// Make the next `take_persist_chunk` return a fresh snapshot, e.g. after
+    /// a chunk failed to write and may have left a torn tail.
+    pub fn invalidate_persisted(&mut self) {
+        self.persisted_snapshot_len = 0;
+    }
+
+    /// Persist the document to `path` right away (see `take_persist_chunk`).
+    pub fn persist_to_file(&mut self, path: &Path) -> std::io::Result<()> {
+        let Some(chunk) = self.take_persist_chunk() else {
+            return Ok(());
+        };
+        match chunk.write_to(path) {
+            Err(e) if matches!(chunk, PersistChunk::Append(_)) => {
+                warn!(
+                    "[notebook-doc] Failed to append changes to {:?}: {}. Rewriting snapshot.",
+                    path, e
+                );
+                self.invalidate_persisted();
+                self.persist_to_file(path)
+            }
+            result => result,
+        }
+    }
+
     /// Save the document to a file.
     pub fn save_to_file(&mut self, path: &Path) -> std::io::Result<()> {
         if let Some(parent) = path.parent() {
@@ -606,6 +703,14 @@ impl NotebookDoc {
         self.doc.sync().generate_sync_message(peer_state)
     }
 
+    /// Current heads of the document.
+    ///
+    /// Comparing heads before and after `receive_sync_message` tells whether
+    /// the message carried any new changes.
+    pub fn get_heads(&mut self) -> Vec<automerge::ChangeHash> {
+        self.doc.get_heads()
+    }
+
     /// Receive and apply a sync message from a peer.
     pub fn receive_sync_message(
         &mut self,
@@ -737,6 +842,12 @@ fn read_str<O: AsRef<automerge::ObjId>, P: Into<automerge::Prop>>(
         })
 }
 
+fn append_to_file(path: &Path, data: &[u8]) -> std::io::Result<()> {
+    use std::io::Write;
+    let mut file = std::fs::OpenOptions::new().append(true).open(path)?;
+    file.write_all(data)
+}
+
 /// Read a metadata value from a raw `AutoCommit` document.
 ///
 /// This is the free-function counterpart of `NotebookDoc::get_metadata`,
@@ -1057,6 +1168,37 @@ mod tests {
         assert_eq!(cells[0].source, "print(1)");
     }
 
+    #[test]
+    fn test_persist_appends_changes_and_reloads() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let path = tmp.path().join("notebook.automerge");
+
+        let mut doc = NotebookDoc::new("persist-test");
+        doc.add_cell(0, "c1", "code").unwrap();
+        doc.persist_to_file(&path).unwrap();
+        let snapshot = std::fs::read(&path).unwrap();
+
+        // A small edit is appended after the snapshot rather than rewriting it
+        doc.update_source("c1", "x = 1").unwrap();
+        doc.persist_to_file(&path).unwrap();
+        let data = std::fs::read(&path).unwrap();
+        assert!(data.len() > snapshot.len());
+        assert_eq!(&data[..snapshot.len()], &snapshot[..]);
+
+        let loaded = NotebookDoc::load_or_create(&path, "persist-test");
+        assert_eq!(loaded.get_cell("c1").unwrap().source, "x = 1");
+
+        // Many edits trigger compaction, keeping the log no larger than the snapshot
+        for i in 0..50 {
+            doc.update_source("c1", &format!("x = {}", i)).unwrap();
+            doc.persist_to_file(&path).unwrap();
+        }
+        let file_len = std::fs::metadata(&path).unwrap().len() as usize;
+        let loaded = NotebookDoc::load_or_create(&path, "persist-test");
+        assert_eq!(loaded.get_cell("c1").unwrap().source, "x = 49");
+        assert!(file_len <= 2 * doc.save().len());
+    }
+
     #[test]
     fn test_load_or_create_missing_file() {
         let tmp = tempfile::TempDir::new().unwrap();
@@ -1102,9 +1244,7 @@ mod tests {
             .unwrap();
 
         // Client starts with an empty doc (like a new window joining)
-        let mut client = NotebookDoc {
-            doc: AutoCommit::new(),
-        };
+        let mut client = NotebookDoc::from_doc(AutoCommit::new());
 
         let mut server_state = sync::State::new();
         let mut client_state = sync::State::new();
@@ -1129,12 +1269,48 @@ mod tests {
         assert_eq!(cells[0].outputs.len(), 1);
     }
 
+    #[test]
+    fn test_heads_unchanged_by_sync_without_changes() {
+        let mut server = NotebookDoc::new("heads-test");
+        server.add_cell(0, "cell-1", "code").unwrap();
+
+        let mut client = NotebookDoc::from_doc(AutoCommit::new());
+        let mut server_state = sync::State::new();
+        let mut client_state = sync::State::new();
+
+        // The client's first message only announces its (empty) heads
+        let msg = client.generate_sync_message(&mut client_state).unwrap();
+        let before = server.get_heads();
+        server.receive_sync_message(&mut server_state, msg).unwrap();
+        assert_eq!(server.get_heads(), before);
+
+        // A client edit moves the server's heads once it arrives
+        for _ in 0..10 {
+            if let Some(msg) = server.generate_sync_message(&mut server_state) {
+                client.receive_sync_message(&mut client_state, msg).unwrap();
+            }
+            if let Some(msg) = client.generate_sync_message(&mut client_state) {
+                server.receive_sync_message(&mut server_state, msg).unwrap();
+            }
+        }
+        client.update_source("cell-1", "x = 1").unwrap();
+        let before = server.get_heads();
+        for _ in 0..10 {
+            if let Some(msg) = client.generate_sync_message(&mut client_state) {
+                server.receive_sync_message(&mut server_state, msg).unwrap();
+            }
+            if let Some(msg) = server.generate_sync_message(&mut server_state) {
+                client.receive_sync_message(&mut client_state, msg).unwrap();
+            }
+        }
+        assert_ne!(server.get_heads(), before);
+        assert_eq!(server.get_cell("cell-1").unwrap().source, "x = 1");
+    }
+
     #[test]
     fn test_concurrent_cell_adds_merge() {
         let mut server = NotebookDoc::new("merge-test");
-        let mut client = NotebookDoc {
-            doc: AutoCommit::new(),
-        };
+        let mut client = NotebookDoc::from_doc(AutoCommit::new());
 
         let mut server_state = sync::State::new();
         let mut client_state = sync::State::new();
@@ -61,6 +61,12 @@ enum SyncCommand {
         cell_type: String,
         reply: oneshot::Sender<Result<(), NotebookSyncError>>,
     },
+    /// Add several cells (`(cell_id, cell_type, source)`) with one sync.
+    AddCells {
+        index: usize,
+        cells: Vec<(String, String, String)>,
+        reply: oneshot::Sender<Result<(), NotebookSyncError>>,
+    },
     DeleteCell {
         cell_id: String,
         reply: oneshot::Sender<Result<(), NotebookSyncError>>,
@@ -87,12 +93,25 @@ enum SyncCommand {
     GetCells {
         reply: oneshot::Sender<Vec<CellSnapshot>>,
     },
+    /// Look up one cell without copying the rest of the notebook.
+    GetCell {
+        cell_id: String,
+        reply: oneshot::Sender<Option<CellSnapshot>>,
+    },
+    GetCellCount {
+        reply: oneshot::Sender<usize>,
+    },
     /// Set a metadata value in the Automerge doc and sync to daemon.
     SetMetadata {
         key: String,
         value: String,
         reply: oneshot::Sender<Result<(), NotebookSyncError>>,
     },
+    /// Set several metadata values and sync to daemon once.
+    SetMetadataBatch {
+        items: Vec<(String, String)>,
+        reply: oneshot::Sender<Result<(), NotebookSyncError>>,
+    },
     /// Read a metadata value from the local Automerge doc replica.
     GetMetadata {
         key: String,
@@ -132,6 +151,29 @@ impl NotebookSyncHandle {
         reply_rx.await.map_err(|_| NotebookSyncError::ChannelClosed)
     }
 
+    /// Get a single cell by ID from the local replica.
+    pub async fn get_cell(&self, cell_id: &str) -> Result<Option<CellSnapshot>, NotebookSyncError> {
+        let (reply_tx, reply_rx) = oneshot::channel();
+        self.tx
+            .send(SyncCommand::GetCell {
+                cell_id: cell_id.to_string(),
+                reply: reply_tx,
+            })
+            .await
+            .map_err(|_| NotebookSyncError::ChannelClosed)?;
+        reply_rx.await.map_err(|_| NotebookSyncError::ChannelClosed)
+    }
+
+    /// Get the number of cells in the local replica.
+    pub async fn cell_count(&self) -> Result<usize, NotebookSyncError> {
+        let (reply_tx, reply_rx) = oneshot::channel();
+        self.tx
+            .send(SyncCommand::GetCellCount { reply: reply_tx })
+            .await
+            .map_err(|_| NotebookSyncError::ChannelClosed)?;
+        reply_rx.await.map_err(|_| NotebookSyncError::ChannelClosed)
+    }
+
     /// Add a new cell at the given index.
     pub async fn add_cell(
         &self,
@@ -154,6 +196,29 @@ impl NotebookSyncHandle {
             .map_err(|_| NotebookSyncError::ChannelClosed)?
     }
 
+    /// Add several cells starting at the given index.
+    ///
+    /// Each entry is `(cell_id, cell_type, source)`. All cells (and their
+    /// sources) reach the daemon in a single sync round-trip.
+    pub async fn add_cells(
+        &self,
+        index: usize,
+        cells: Vec<(String, String, String)>,
+    ) -> Result<(), NotebookSyncError> {
+        let (reply_tx, reply_rx) = oneshot::channel();
+        self.tx
+            .send(SyncCommand::AddCells {
+                index,
+                cells,
+                reply: reply_tx,
+            })
+            .await
+            .map_err(|_| NotebookSyncError::ChannelClosed)?;
+        reply_rx
+            .await
+            .map_err(|_| NotebookSyncError::ChannelClosed)?
+    }
+
     /// Delete a cell by ID.
     pub async fn delete_cell(&self, cell_id: &str) -> Result<(), NotebookSyncError> {
         let (reply_tx, reply_rx) = oneshot::channel();
@@ -260,6 +325,24 @@ impl NotebookSyncHandle {
             .map_err(|_| NotebookSyncError::ChannelClosed)?
     }
 
+    /// Set several metadata values in the Automerge doc with a single sync.
+    pub async fn set_metadata_batch(
+        &self,
+        items: Vec<(String, String)>,
+    ) -> Result<(), NotebookSyncError> {
+        let (reply_tx, reply_rx) = oneshot::channel();
+        self.tx
+            .send(SyncCommand::SetMetadataBatch {
+                items,
+                reply: reply_tx,
+            })
+            .await
+            .map_err(|_| NotebookSyncError::ChannelClosed)?;
+        reply_rx
+            .await
+            .map_err(|_| NotebookSyncError::ChannelClosed)?
+    }
+
     /// Read a metadata value from the local Automerge doc replica.
     pub async fn get_metadata(&self, key: &str) -> Result<Option<String>, NotebookSyncError> {
         let (reply_tx, reply_rx) = oneshot::channel();
@@ -356,6 +439,9 @@ pub struct NotebookSyncClient<S> {
     /// Broadcasts received during initial sync (before split).
     /// These are delivered immediately after into_split creates the channels.
     pending_broadcasts: Vec<NotebookBroadcast>,
+    /// Cells materialized at the given doc heads. `get_cells` reuses the
+    /// snapshot until a local write or incoming sync moves the heads.
+    cells_cache: Option<(Vec<automerge::ChangeHash>, Vec<CellSnapshot>)>,
 }
 
 #[cfg(unix)]
@@ -634,6 +720,7 @@ where
             pending_broadcasts.len(),
             if use_typed_frames { "v2" } else { "v1" }
         );
+        let cells_cache = Some((doc.get_heads(), cells));
 
         Ok(Self {
             doc,
@@ -642,6 +729,7 @@ where
             notebook_id,
             use_typed_frames,
             pending_broadcasts,
+            cells_cache,
         })
     }
 
@@ -653,13 +741,26 @@ where
     // ── Read operations ─────────────────────────────────────────────
 
     /// Get all cells from the local replica.
-    pub fn get_cells(&self) -> Vec<CellSnapshot> {
-        get_cells_from_doc(&self.doc)
+    ///
+    /// The document is only walked again when its heads have changed since
+    /// the last call; otherwise the cached snapshot is borrowed as-is. Call
+    /// `.to_vec()` on the result when an owned copy is needed.
+    pub fn get_cells(&mut self) -> &[CellSnapshot] {
+        let heads = self.doc.get_heads();
+        let stale = !matches!(&self.cells_cache, Some((cached, _)) if *cached == heads);
+        if stale {
+            let cells = get_cells_from_doc(&self.doc);
+            self.cells_cache = Some((heads, cells));
+        }
+        self.cells_cache
+            .as_ref()
+            .map(|(_, cells)| cells.as_slice())
+            .unwrap_or_default()
     }
 
     /// Get a single cell by ID from the local replica.
-    pub fn get_cell(&self, cell_id: &str) -> Option<CellSnapshot> {
-        self.get_cells().into_iter().find(|c| c.id == cell_id)
+    pub fn get_cell(&mut self, cell_id: &str) -> Option<CellSnapshot> {
+        self.get_cells().iter().find(|c| c.id == cell_id).cloned()
     }
 
     /// Read a metadata value from the local Automerge doc replica.
@@ -676,6 +777,21 @@ where
         self.sync_to_daemon().await
     }
 
+    /// Set several metadata values and sync to daemon once.
+    ///
+    /// All writes land in the local doc before syncing, so peers receive
+    /// them in one sync message.
+    pub async fn set_metadata_batch(
+        &mut self,
+        items: &[(String, String)],
+    ) -> Result<(), NotebookSyncError> {
+        for (key, value) in items {
+            set_metadata_in_doc(&mut self.doc, key, value)
+                .map_err(|e| NotebookSyncError::SyncError(format!("set_metadata: {}", e)))?;
+        }
+        self.sync_to_daemon().await
+    }
+
     /// Add a new cell at the given index and sync to daemon.
     pub async fn add_cell(
         &mut self,
@@ -690,25 +806,36 @@ where
         let len = self.doc.length(&cells_id);
         let index = index.min(len);
 
-        let cell_map = self
-            .doc
-            .insert_object(&cells_id, index, ObjType::Map)
-            .map_err(|e| NotebookSyncError::SyncError(format!("insert: {}", e)))?;
-        self.doc
-            .put(&cell_map, "id", cell_id)
-            .map_err(|e| NotebookSyncError::SyncError(format!("put id: {}", e)))?;
-        self.doc
-            .put(&cell_map, "cell_type", cell_type)
-            .map_err(|e| NotebookSyncError::SyncError(format!("put type: {}", e)))?;
-        self.doc
-            .put_object(&cell_map, "source", ObjType::Text)
-            .map_err(|e| NotebookSyncError::SyncError(format!("put source: {}", e)))?;
-        self.doc
-            .put(&cell_map, "execution_count", "null")
-            .map_err(|e| NotebookSyncError::SyncError(format!("put exec_count: {}", e)))?;
-        self.doc
-            .put_object(&cell_map, "outputs", ObjType::List)
-            .map_err(|e| NotebookSyncError::SyncError(format!("put outputs: {}", e)))?;
+        self.insert_cell(&cells_id, index, cell_id, cell_type)?;
+
+        self.sync_to_daemon().await
+    }
+
+    /// Add several cells starting at the given index and sync to daemon once.
+    ///
+    /// Each entry is `(cell_id, cell_type, source)`. Cells are inserted in
+    /// order, so the first entry ends up at `index`.
+    pub async fn add_cells(
+        &mut self,
+        index: usize,
+        cells: &[(String, String, String)],
+    ) -> Result<(), NotebookSyncError> {
+        let cells_id = self
+            .ensure_cells_list()
+            .map_err(|e| NotebookSyncError::SyncError(format!("ensure cells: {}", e)))?;
+
+        let len = self.doc.length(&cells_id);
+        let mut index = index.min(len);
+
+        for (cell_id, cell_type, source) in cells {
+            let source_id = self.insert_cell(&cells_id, index, cell_id, cell_type)?;
+            if !source.is_empty() {
+                self.doc
+                    .update_text(&source_id, source)
+                    .map_err(|e| NotebookSyncError::SyncError(format!("update_text: {}", e)))?;
+            }
+            index += 1;
+        }
 
         self.sync_to_daemon().await
     }
@@ -915,7 +1042,7 @@ where
                     connection::send_frame(&mut self.stream, &msg.encode()).await?;
                 }
 
-                Ok(self.get_cells())
+                Ok(self.get_cells().to_vec())
             }
             None => Err(NotebookSyncError::Disconnected),
         }
@@ -943,12 +1070,12 @@ where
                         .await?;
                     }
 
-                    Ok(self.get_cells())
+                    Ok(self.get_cells().to_vec())
                 }
                 NotebookFrameType::Broadcast => {
                     // For now, ignore broadcast frames - caller can handle separately
                     // In the future, we could return them or emit events
-                    Ok(self.get_cells())
+                    Ok(self.get_cells().to_vec())
                 }
                 _ => {
                     // Unexpected frame type
@@ -956,7 +1083,7 @@ where
                         "[notebook-sync-client] Unexpected frame type in recv_changes: {:?}",
                         frame.frame_type
                     );
-                    Ok(self.get_cells())
+                    Ok(self.get_cells().to_vec())
                 }
             },
             None => Err(NotebookSyncError::Disconnected),
@@ -1014,7 +1141,7 @@ where
                             .await?;
                         }
 
-                        Ok(Some(ReceivedFrame::Changes(self.get_cells())))
+                        Ok(Some(ReceivedFrame::Changes(self.get_cells().to_vec())))
                     }
                     NotebookFrameType::Broadcast => {
                         let broadcast: NotebookBroadcast = serde_json::from_slice(&frame.payload)
@@ -1230,6 +1357,39 @@ where
         self.doc.put_object(automerge::ROOT, "cells", ObjType::List)
     }
 
+    /// Insert an empty cell map into the local doc without syncing.
+    ///
+    /// Returns the ObjId of the cell's `source` Text.
+    fn insert_cell(
+        &mut self,
+        cells_id: &automerge::ObjId,
+        index: usize,
+        cell_id: &str,
+        cell_type: &str,
+    ) -> Result<automerge::ObjId, NotebookSyncError> {
+        let cell_map = self
+            .doc
+            .insert_object(cells_id, index, ObjType::Map)
+            .map_err(|e| NotebookSyncError::SyncError(format!("insert: {}", e)))?;
+        self.doc
+            .put(&cell_map, "id", cell_id)
+            .map_err(|e| NotebookSyncError::SyncError(format!("put id: {}", e)))?;
+        self.doc
+            .put(&cell_map, "cell_type", cell_type)
+            .map_err(|e| NotebookSyncError::SyncError(format!("put type: {}", e)))?;
+        let source_id = self
+            .doc
+            .put_object(&cell_map, "source", ObjType::Text)
+            .map_err(|e| NotebookSyncError::SyncError(format!("put source: {}", e)))?;
+        self.doc
+            .put(&cell_map, "execution_count", "null")
+            .map_err(|e| NotebookSyncError::SyncError(format!("put exec_count: {}", e)))?;
+        self.doc
+            .put_object(&cell_map, "outputs", ObjType::List)
+            .map_err(|e| NotebookSyncError::SyncError(format!("put outputs: {}", e)))?;
+        Ok(source_id)
+    }
+
     fn cell_at_index(&self, cells_id: &automerge::ObjId, index: usize) -> Option<automerge::ObjId> {
         self.doc
             .get(cells_id, index)
@@ -1307,7 +1467,7 @@ where
     /// The client is consumed and a background task is spawned to process
     /// both commands and incoming changes concurrently.
     pub fn into_split(
-        self,
+        mut self,
     ) -> (
         NotebookSyncHandle,
         NotebookSyncReceiver,
@@ -1315,7 +1475,7 @@ where
         Vec<CellSnapshot>,
         Option<String>,
     ) {
-        let initial_cells = self.get_cells();
+        let initial_cells = self.get_cells().to_vec();
         let initial_metadata = self.get_metadata(NOTEBOOK_METADATA_KEY);
         let notebook_id = self.notebook_id.clone();
         let pending_broadcasts = self.pending_broadcasts.clone();
@@ -1434,6 +1594,10 @@ async fn run_sync_task<S>(
                                 let result = client.add_cell(index, &cell_id, &cell_type).await;
                                 let _ = reply.send(result);
                             }
+                            SyncCommand::AddCells { index, cells, reply } => {
+                                let result = client.add_cells(index, &cells).await;
+                                let _ = reply.send(result);
+                            }
                             SyncCommand::DeleteCell { cell_id, reply } => {
                                 let result = client.delete_cell(&cell_id).await;
                                 let _ = reply.send(result);
@@ -1455,13 +1619,23 @@ async fn run_sync_task<S>(
                                 let _ = reply.send(result);
                             }
                             SyncCommand::GetCells { reply } => {
-                                let cells = client.get_cells();
+                                let cells = client.get_cells().to_vec();
                                 let _ = reply.send(cells);
                             }
+                            SyncCommand::GetCell { cell_id, reply } => {
+                                let _ = reply.send(client.get_cell(&cell_id));
+                            }
+                            SyncCommand::GetCellCount { reply } => {
+                                let _ = reply.send(client.get_cells().len());
+                            }
                             SyncCommand::SetMetadata { key, value, reply } => {
                                 let result = client.set_metadata(&key, &value).await;
                                 let _ = reply.send(result);
                             }
+                            SyncCommand::SetMetadataBatch { items, reply } => {
+                                let result = client.set_metadata_batch(&items).await;
+                                let _ = reply.send(result);
+                            }
                             SyncCommand::GetMetadata { key, reply } => {
                                 let result = client.get_metadata(&key);
                                 let _ = reply.send(result);
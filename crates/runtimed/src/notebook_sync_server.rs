@@ -26,7 +26,7 @@
 
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
-use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
 use std::sync::Arc;
 
 use automerge::sync;
@@ -38,7 +38,7 @@ use crate::blob_store::BlobStore;
 use crate::comm_state::CommState;
 use crate::connection::{self, NotebookFrameType};
 use crate::kernel_manager::{DenoLaunchedConfig, LaunchedEnvConfig, RoomKernel};
-use crate::notebook_doc::{notebook_doc_filename, NotebookDoc};
+use crate::notebook_doc::{notebook_doc_filename, NotebookDoc, PersistChunk};
 use crate::notebook_metadata::{NotebookMetadataSnapshot, NOTEBOOK_METADATA_KEY};
 use crate::protocol::{EnvSyncDiff, NotebookBroadcast, NotebookRequest, NotebookResponse};
 
@@ -456,6 +456,8 @@ pub struct NotebookRoom {
     pub kernel_broadcast_tx: broadcast::Sender<NotebookBroadcast>,
     /// Persistence path for this room's document.
     pub persist_path: PathBuf,
+    /// Writes the document to `persist_path` outside the doc lock.
+    pub persister: NotebookPersister,
     /// Number of active peer connections in this room.
     pub active_peers: AtomicUsize,
     /// Optional kernel for this room (Phase 8: daemon-owned execution).
@@ -518,6 +520,7 @@ impl NotebookRoom {
             doc: Arc::new(RwLock::new(doc)),
             changed_tx,
             kernel_broadcast_tx,
+            persister: NotebookPersister::spawn(persist_path.clone()),
             persist_path,
             active_peers: AtomicUsize::new(0),
             kernel: Arc::new(Mutex::new(None)),
@@ -547,6 +550,7 @@ impl NotebookRoom {
             doc: Arc::new(RwLock::new(doc)),
             changed_tx,
             kernel_broadcast_tx,
+            persister: NotebookPersister::spawn(persist_path.clone()),
             persist_path,
             active_peers: AtomicUsize::new(0),
             kernel: Arc::new(Mutex::new(None)),
@@ -816,26 +820,24 @@ where
                         let message = sync::Message::decode(&data)
                             .map_err(|e| anyhow::anyhow!("decode error: {}", e))?;
 
-                        // Serialize bytes inside the lock, then persist outside it
-                        let persist_bytes = {
-                            let mut doc = room.doc.write().await;
-                            doc.receive_sync_message(&mut peer_state, message)?;
+                        // Messages that carry no new changes (acks, have/need
+                        // negotiation) leave the heads untouched and skip both
+                        // the persist and the peer notification.
+                        let mut doc = room.doc.write().await;
+                        let heads_before = doc.get_heads();
+                        doc.receive_sync_message(&mut peer_state, message)?;
 
-                            let bytes = doc.save();
+                        if doc.get_heads() != heads_before {
+                            room.persister.persist(&mut doc);
 
                             // Notify other peers in this room
                             let _ = room.changed_tx.send(());
+                        }
 
-                            // Send our response while still holding the lock (raw frame)
-                            if let Some(reply) = doc.generate_sync_message(&mut peer_state) {
-                                connection::send_frame(writer, &reply.encode()).await?;
-                            }
-
-                            bytes
-                        };
-
-                        // Persist outside the write lock
-                        persist_notebook_bytes(&persist_bytes, &room.persist_path);
+                        // Send our response while still holding the lock (raw frame)
+                        if let Some(reply) = doc.generate_sync_message(&mut peer_state) {
+                            connection::send_frame(writer, &reply.encode()).await?;
+                        }
                     }
                     None => {
                         // Client disconnected
@@ -913,15 +915,20 @@ where
                                 let message = sync::Message::decode(&frame.payload)
                                     .map_err(|e| anyhow::anyhow!("decode error: {}", e))?;
 
-                                // Serialize bytes inside the lock, then persist outside it
-                                let persist_bytes = {
+                                // Messages without new changes skip the persist and the
+                                // peer notification (see run_sync_loop_v1).
+                                let changed = {
                                     let mut doc = room.doc.write().await;
+                                    let heads_before = doc.get_heads();
                                     doc.receive_sync_message(&mut peer_state, message)?;
 
-                                    let bytes = doc.save();
+                                    let changed = doc.get_heads() != heads_before;
+                                    if changed {
+                                        room.persister.persist(&mut doc);
 
-                                    // Notify other peers in this room
-                                    let _ = room.changed_tx.send(());
+                                        // Notify other peers in this room
+                                        let _ = room.changed_tx.send(());
+                                    }
 
                                     // Send our response while still holding the lock
                                     if let Some(reply) = doc.generate_sync_message(&mut peer_state) {
@@ -933,14 +940,13 @@ where
                                         .await?;
                                     }
 
-                                    bytes
+                                    changed
                                 };
 
-                                // Persist outside the write lock
-                                persist_notebook_bytes(&persist_bytes, &room.persist_path);
-
-                                // Check if metadata changed and kernel is running - broadcast sync state
-                                check_and_broadcast_sync_state(room).await;
+                                if changed {
+                                    // Check if metadata changed and kernel is running - broadcast sync state
+                                    check_and_broadcast_sync_state(room).await;
+                                }
                             }
 
                             NotebookFrameType::Request => {
@@ -1103,7 +1109,7 @@ async fn auto_launch_kernel(
     let mut kernel = RoomKernel::new(
         room.kernel_broadcast_tx.clone(),
         room.doc.clone(),
-        room.persist_path.clone(),
+        room.persister.clone(),
         room.changed_tx.clone(),
         room.blob_store.clone(),
         room.comm_state.clone(),
@@ -1404,6 +1410,17 @@ async fn auto_launch_kernel(
                             }
                             QueueCommand::CellError { cell_id } => {
                                 warn!("[notebook-sync] Cell error (stop-on-error): {}", cell_id);
+                                // Clear the queue to stop execution on error
+                                let mut guard = room_kernel.lock().await;
+                                if let Some(ref mut k) = *guard {
+                                    let cleared = k.clear_queue();
+                                    if !cleared.is_empty() {
+                                        info!(
+                                            "[notebook-sync] Cleared {} queued cells due to error",
+                                            cleared.len()
+                                        );
+                                    }
+                                }
                             }
                         }
                     }
@@ -1472,7 +1489,7 @@ async fn handle_notebook_request(
             let mut kernel = RoomKernel::new(
                 room.kernel_broadcast_tx.clone(),
                 room.doc.clone(),
-                room.persist_path.clone(),
+                room.persister.clone(),
                 room.changed_tx.clone(),
                 room.blob_store.clone(),
                 room.comm_state.clone(),
@@ -1825,8 +1842,8 @@ async fn handle_notebook_request(
         }
 
         NotebookRequest::ClearOutputs { cell_id } => {
-            // 1. Mutate the Automerge document to remove outputs
-            let persist_bytes = {
+            // 1. Mutate the Automerge document to remove outputs, then persist
+            {
                 let mut doc = room.doc.write().await;
                 if let Err(e) = doc.clear_outputs(&cell_id) {
                     return NotebookResponse::Error {
@@ -1835,23 +1852,19 @@ async fn handle_notebook_request(
                 }
                 // Also reset execution count
                 let _ = doc.set_execution_count(&cell_id, "null");
-                let bytes = doc.save();
+                room.persister.persist(&mut doc);
                 // Notify other peers of doc change
                 let _ = room.changed_tx.send(());
-                bytes
-            };
-
-            // 2. Persist outside the write lock
-            persist_notebook_bytes(&persist_bytes, &room.persist_path);
+            }
 
-            // 3. Broadcast for cross-window UI sync (fast path)
+            // 2. Broadcast for cross-window UI sync (fast path)
             let _ = room
                 .kernel_broadcast_tx
                 .send(NotebookBroadcast::OutputsCleared {
                     cell_id: cell_id.clone(),
                 });
 
-            // 4. Update kernel's internal tracking if kernel exists
+            // 3. Update kernel's internal tracking if kernel exists
             let kernel_guard = room.kernel.lock().await;
             if let Some(ref kernel) = *kernel_guard {
                 kernel.clear_outputs(&cell_id).await;
@@ -2430,19 +2443,93 @@ async fn resolve_cell_output(output_str: &str, blob_store: &BlobStore) -> serde_
     }
 }
 
-/// Persist pre-serialized notebook bytes to disk.
-pub(crate) fn persist_notebook_bytes(data: &[u8], path: &Path) {
-    if let Some(parent) = path.parent() {
-        if let Err(e) = std::fs::create_dir_all(parent) {
-            warn!(
-                "[notebook-sync] Failed to create parent dir for {:?}: {}",
-                path, e
-            );
-            return;
+enum PersistMessage {
+    Write(PersistChunk),
+    #[cfg(test)]
+    Flush(std::sync::mpsc::Sender<()>),
+}
+
+/// Writes a room's notebook doc to disk on a dedicated thread.
+///
+/// `persist` runs with the doc write lock held but only serializes the
+/// changes and queues them, so peers' sync never waits on the disk. The
+/// thread writes chunks in the order they were queued. After a failed write
+/// it drops further appends until a fresh snapshot, which the next `persist`
+/// takes, repairs the file.
+#[derive(Clone)]
+pub struct NotebookPersister {
+    tx: tokio::sync::mpsc::UnboundedSender<PersistMessage>,
+    /// Set by the writer after a failed write; the next `persist` snapshots.
+    needs_snapshot: Arc<AtomicBool>,
+}
+
+impl NotebookPersister {
+    /// Start the writer thread for `path`.
+    ///
+    /// The thread exits once every clone is dropped and the queue is written.
+    pub fn spawn(path: PathBuf) -> Self {
+        let (tx, mut rx) = tokio::sync::mpsc::unbounded_channel();
+        let needs_snapshot = Arc::new(AtomicBool::new(false));
+        let writer_needs_snapshot = needs_snapshot.clone();
+
+        let spawned = std::thread::Builder::new()
+            .name("notebook-persist".to_string())
+            .spawn(move || {
+                // True from a failed write until a snapshot lands
+                let mut torn = false;
+                while let Some(message) = rx.blocking_recv() {
+                    match message {
+                        PersistMessage::Write(chunk) => {
+                            let is_snapshot = matches!(chunk, PersistChunk::Snapshot(_));
+                            if torn && !is_snapshot {
+                                continue;
+                            }
+                            match chunk.write_to(&path) {
+                                Ok(()) => torn = false,
+                                Err(e) => {
+                                    warn!(
+                                        "[notebook-sync] Failed to save notebook doc to {:?}: {}",
+                                        path, e
+                                    );
+                                    torn = true;
+                                    writer_needs_snapshot.store(true, Ordering::Release);
+                                }
+                            }
+                        }
+                        #[cfg(test)]
+                        PersistMessage::Flush(done) => {
+                            let _ = done.send(());
+                        }
+                    }
+                }
+            });
+        if let Err(e) = spawned {
+            error!("[notebook-sync] Failed to start notebook writer thread: {}", e);
         }
+
+        Self { tx, needs_snapshot }
     }
-    if let Err(e) = std::fs::write(path, data) {
-        warn!("[notebook-sync] Failed to save notebook doc: {}", e);
+
+    /// Queue the doc's unpersisted changes for writing.
+    ///
+    /// Call with the doc write lock held, so chunks are queued in the order
+    /// they were taken from the doc.
+    pub fn persist(&self, doc: &mut NotebookDoc) {
+        if self.needs_snapshot.swap(false, Ordering::AcqRel) {
+            doc.invalidate_persisted();
+        }
+        if let Some(chunk) = doc.take_persist_chunk() {
+            let _ = self.tx.send(PersistMessage::Write(chunk));
+        }
+    }
+
+    /// Wait until every chunk queued so far has been written.
+    #[cfg(test)]
+    pub fn flush(&self) {
+        let (done_tx, done_rx) = std::sync::mpsc::channel();
+        if self.tx.send(PersistMessage::Flush(done_tx)).is_ok() {
+            let _ = done_rx.recv();
+        }
     }
 }
 
@@ -2478,8 +2565,8 @@ mod tests {
             let mut doc = room.doc.try_write().unwrap();
             doc.add_cell(0, "c1", "code").unwrap();
             doc.update_source("c1", "hello").unwrap();
-            let bytes = doc.save();
-            persist_notebook_bytes(&bytes, &room.persist_path);
+            room.persister.persist(&mut doc);
+            room.persister.flush();
         }
 
         // Load again — should have the cell
@@ -2492,6 +2579,32 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_persister_rewrites_snapshot_after_failed_append() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let path = tmp.path().join("doc.automerge");
+        let persister = NotebookPersister::spawn(path.clone());
+
+        let mut doc = NotebookDoc::new("persist-test");
+        doc.add_cell(0, "c1", "code").unwrap();
+        persister.persist(&mut doc);
+        persister.flush();
+
+        // Appending to a file that is gone fails; the next persist repairs it
+        std::fs::remove_file(&path).unwrap();
+        doc.update_source("c1", "lost append").unwrap();
+        persister.persist(&mut doc);
+        persister.flush();
+        assert!(!path.exists());
+
+        doc.update_source("c1", "recovered").unwrap();
+        persister.persist(&mut doc);
+        persister.flush();
+
+        let loaded = NotebookDoc::load_or_create(&path, "persist-test");
+        assert_eq!(loaded.get_cell("c1").unwrap().source, "recovered");
+    }
+
     #[test]
     fn test_get_or_create_room_reuses_existing() {
         let tmp = tempfile::TempDir::new().unwrap();
@@ -2560,8 +2673,8 @@ mod tests {
             let mut doc = room.doc.try_write().unwrap();
             doc.add_cell(0, "c1", "code").unwrap();
             doc.update_source("c1", "old content").unwrap();
-            let bytes = doc.save();
-            persist_notebook_bytes(&bytes, &room.persist_path);
+            room.persister.persist(&mut doc);
+            room.persister.flush();
         }
 
         // Verify persisted file exists
@@ -2732,6 +2845,7 @@ mod tests {
             changed_tx,
             kernel_broadcast_tx,
             persist_path: tmp.path().join("doc.automerge"),
+            persister: NotebookPersister::spawn(tmp.path().join("doc.automerge")),
             active_peers: AtomicUsize::new(0),
             kernel: Arc::new(Mutex::new(None)),
             blob_store,
@@ -121,12 +121,15 @@ impl StreamTerminals {
         // Feed input to terminal, converting \n to \r\n
         // A raw \n (line feed) only moves cursor down without returning to column 0.
         // We need \r\n to properly start at the beginning of the next line.
-        for byte in text.as_bytes() {
-            if *byte == b'\n' {
-                processor.advance(term, b"\r\n");
-            } else {
-                processor.advance(term, std::slice::from_ref(byte));
-            }
+        // The text between newlines goes to the parser as one slice, so runs of
+        // plain text take its bulk path instead of one call per byte.
+        let mut lines = text.as_bytes().split(|byte| *byte == b'\n');
+        if let Some(first) = lines.next() {
+            processor.advance(term, first);
+        }
+        for line in lines {
+            processor.advance(term, b"\r\n");
+            processor.advance(term, line);
         }
 
         // Serialize terminal content back to ANSI text
@@ -345,15 +348,11 @@ fn serialize_to_ansi(term: &Term<VoidListener>) -> String {
         result.push_str("\x1b[0m");
     }
 
-    // Trim trailing whitespace from each line (safety net for edge cases)
-    let lines: Vec<&str> = result.lines().collect();
-    let trimmed_lines: Vec<String> = lines
-        .iter()
-        .map(|line| line.trim_end().to_string())
-        .collect();
+    // Trim trailing whitespace from each line (safety net for edge cases).
+    // The trimmed lines borrow from `result`, so only the final join allocates.
+    let mut final_lines: Vec<&str> = result.lines().map(str::trim_end).collect();
 
     // Remove trailing empty lines
-    let mut final_lines = trimmed_lines;
     while final_lines.last().is_some_and(|l| l.is_empty()) {
         final_lines.pop();
     }
@@ -434,6 +433,15 @@ mod tests {
         assert!(result.contains("line3"));
     }
 
+    #[test]
+    fn test_carriage_return_between_newlines() {
+        let mut terminals = StreamTerminals::new();
+        let result =
+            terminals.feed("cell-1", "stdout", "start\nLoading: 50%\rLoading: 100%\n\ndone");
+        assert!(result.contains("start\nLoading: 100%\n\ndone"));
+        assert!(!result.contains("Loading: 50%"));
+    }
+
     #[test]
     fn test_colors() {
         let mut terminals = StreamTerminals::new();
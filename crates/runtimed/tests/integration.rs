@@ -308,7 +308,7 @@ async fn test_notebook_sync_via_unified_socket() {
         .unwrap();
 
     // Connect second client to the same notebook — should see the cell
-    let client2 = NotebookSyncClient::connect(socket_path.clone(), "test-notebook".to_string())
+    let mut client2 = NotebookSyncClient::connect(socket_path.clone(), "test-notebook".to_string())
         .await
         .expect("client2 should connect");
 
@@ -319,7 +319,7 @@ async fn test_notebook_sync_via_unified_socket() {
     assert_eq!(cells[0].cell_type, "code");
 
     // Connect to a different notebook — should be independent
-    let client3 = NotebookSyncClient::connect(socket_path.clone(), "other-notebook".to_string())
+    let mut client3 = NotebookSyncClient::connect(socket_path.clone(), "other-notebook".to_string())
         .await
         .expect("client3 should connect");
 
@@ -428,7 +428,7 @@ async fn test_notebook_room_eviction_and_persistence() {
 
     // Phase 2: Reconnect — the room should be fresh (not loaded from persisted state)
     // This matches the design: .ipynb is source of truth, Automerge is just sync layer
-    let client3 = NotebookSyncClient::connect(socket_path.clone(), "evict-test".to_string())
+    let mut client3 = NotebookSyncClient::connect(socket_path.clone(), "evict-test".to_string())
         .await
         .expect("should reconnect after room eviction");
 
@@ -482,7 +482,7 @@ async fn test_notebook_cell_delete_propagation() {
     client1.delete_cell("to-delete").await.unwrap();
 
     // Client2 receives the deletion
-    let mut final_cells = client2.get_cells();
+    let mut final_cells = client2.get_cells().to_vec();
     for _ in 0..10 {
         match tokio::time::timeout(Duration::from_millis(200), client2.recv_changes()).await {
             Ok(Ok(cells)) => {
@@ -567,12 +567,12 @@ async fn test_multiple_notebooks_concurrent_isolation() {
         NotebookSyncClient::connect(socket_path.clone(), "nb-gamma".to_string()),
     );
 
-    let cells_a = fresh_a.unwrap().get_cells();
+    let cells_a = fresh_a.unwrap().get_cells().to_vec();
     assert_eq!(cells_a.len(), 1, "nb-alpha should have 1 cell");
     assert_eq!(cells_a[0].id, "alpha-1");
     assert_eq!(cells_a[0].source, "print('alpha')");
 
-    let cells_b = fresh_b.unwrap().get_cells();
+    let cells_b = fresh_b.unwrap().get_cells().to_vec();
     assert_eq!(cells_b.len(), 2, "nb-beta should have 2 cells");
     assert!(cells_b
         .iter()
@@ -581,7 +581,7 @@ async fn test_multiple_notebooks_concurrent_isolation() {
         .iter()
         .any(|c| c.id == "beta-2" && c.source == "x = 99"));
 
-    let cells_c = fresh_c.unwrap().get_cells();
+    let cells_c = fresh_c.unwrap().get_cells().to_vec();
     assert_eq!(cells_c.len(), 3, "nb-gamma should have 3 cells");
     assert!(cells_c
         .iter()
@@ -636,7 +636,7 @@ async fn test_notebook_append_and_clear_outputs() {
         .unwrap();
 
     // Client2 connects and should see all 3 outputs
-    let client2 = NotebookSyncClient::connect(socket_path.clone(), "output-test".to_string())
+    let mut client2 = NotebookSyncClient::connect(socket_path.clone(), "output-test".to_string())
         .await
         .unwrap();
 
@@ -684,7 +684,7 @@ async fn test_notebook_append_and_clear_outputs() {
         .unwrap();
 
     // Verify via a fresh client
-    let client3 = NotebookSyncClient::connect(socket_path.clone(), "output-test".to_string())
+    let mut client3 = NotebookSyncClient::connect(socket_path.clone(), "output-test".to_string())
         .await
         .unwrap();
     let cell = client3.get_cell("c1").expect("should have c1");
@@ -13,6 +13,7 @@ from runtimed.runtimed import (
     Output,
     RuntimedError,
     Session,
+    default_socket_path,
 )
 
 __all__ = [
@@ -25,6 +26,7 @@ __all__ = [
     "Session",
     # Daemon client API - async
     "AsyncSession",
+    "default_socket_path",
     # Output types
     "ExecutionResult",
     "Output",
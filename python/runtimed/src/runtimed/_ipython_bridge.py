@@ -37,6 +37,8 @@ class IPythonBridge:
     def __init__(self, ip: str = "127.0.0.1") -> None:
         self._ip = ip
         self._key = uuid.uuid4().hex
+        # Keyed HMAC state is built once and copied per message
+        self._auth = hmac.new(self._key.encode(), digestmod=hashlib.sha256)
         self._session_id = uuid.uuid4().hex
         self._execution_count = 0
         self._running = True
@@ -62,12 +64,15 @@ class IPythonBridge:
 
         self._connection_file = self._write_connection_file()
 
-        # Start background responder threads
-        self._shell_thread = threading.Thread(target=self._shell_loop, daemon=True)
-        self._shell_thread.start()
+        # Shell msg_type -> handler(identities, parent_header, content)
+        self._shell_handlers = {
+            "kernel_info_request": self._handle_kernel_info,
+            "execute_request": self._handle_execute,
+        }
 
-        self._hb_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
-        self._hb_thread.start()
+        # Start background responder thread (serves shell and heartbeat)
+        self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._poll_thread.start()
 
     @property
     def connection_file(self) -> Path:
@@ -104,7 +109,7 @@ class IPythonBridge:
         }
 
     def _sign(self, *parts: bytes) -> bytes:
-        h = hmac.new(self._key.encode(), digestmod=hashlib.sha256)
+        h = self._auth.copy()
         for part in parts:
             h.update(part)
         return h.hexdigest().encode()
@@ -120,8 +125,9 @@ class IPythonBridge:
     ) -> None:
         header = self._make_header(msg_type)
         header_b = json.dumps(header).encode()
-        parent_b = json.dumps(parent_header or {}).encode()
-        meta_b = json.dumps(metadata or {}).encode()
+        # Most IOPub messages carry no parent or metadata; skip encoding "{}"
+        parent_b = json.dumps(parent_header).encode() if parent_header else b"{}"
+        meta_b = json.dumps(metadata).encode() if metadata else b"{}"
         content_b = json.dumps(content).encode()
         sig = self._sign(header_b, parent_b, meta_b, content_b)
 
@@ -138,30 +144,42 @@ class IPythonBridge:
 
     # --- Background responders ---
 
-    def _shell_loop(self) -> None:
+    def _poll_loop(self) -> None:
+        # A single poller services both sockets, so neither waits on the
+        # other's timeout and close() only has one thread to join.
+        poller = zmq.Poller()
+        poller.register(self._shell_socket, zmq.POLLIN)
+        poller.register(self._hb_socket, zmq.POLLIN)
         while self._running:
             try:
-                if not self._shell_socket.poll(1000):
-                    continue
-                parts = self._shell_socket.recv_multipart()
-                try:
-                    delim_idx = parts.index(b"<IDS|MSG>")
-                except ValueError:
-                    continue
-                identities = parts[:delim_idx]
-                header = json.loads(parts[delim_idx + 2])
-
-                if header["msg_type"] == "kernel_info_request":
-                    self._handle_kernel_info(identities, header)
-                elif header["msg_type"] == "execute_request":
-                    content = json.loads(parts[delim_idx + 5])
-                    self._handle_execute(identities, header, content)
+                events = dict(poller.poll(1000))
+                if self._hb_socket in events:
+                    msg = self._hb_socket.recv()
+                    self._hb_socket.send(msg)
+                if self._shell_socket in events:
+                    self._handle_shell(self._shell_socket.recv_multipart())
             except zmq.ZMQError:
                 break
             except Exception:
                 continue
 
-    def _handle_kernel_info(self, identities: list[bytes], parent: dict) -> None:
+    def _handle_shell(self, parts: list[bytes]) -> None:
+        try:
+            delim_idx = parts.index(b"<IDS|MSG>")
+        except ValueError:
+            return
+        identities = parts[:delim_idx]
+        header = json.loads(parts[delim_idx + 2])
+
+        handler = self._shell_handlers.get(header["msg_type"])
+        if handler is None:
+            return
+        content = json.loads(parts[delim_idx + 5])
+        handler(identities, header, content)
+
+    def _handle_kernel_info(
+        self, identities: list[bytes], parent: dict, content: dict
+    ) -> None:
         reply = {
             "status": "ok",
             "protocol_version": "5.3",
@@ -212,16 +230,6 @@ class IPythonBridge:
         }
         self._send(self._shell_socket, identities, "execute_reply", parent, reply)
 
-    def _heartbeat_loop(self) -> None:
-        while self._running:
-            try:
-                if not self._hb_socket.poll(1000):
-                    continue
-                msg = self._hb_socket.recv()
-                self._hb_socket.send(msg)
-            except zmq.ZMQError:
-                break
-
     # --- IPython hook methods (called from main thread) ---
 
     def publish_execute_result(
@@ -255,9 +263,8 @@ class IPythonBridge:
 
     def close(self) -> None:
         self._running = False
-        # Wait for background threads to notice _running=False and exit
-        self._shell_thread.join(timeout=2)
-        self._hb_thread.join(timeout=2)
+        # Wait for the background thread to notice _running=False and exit
+        self._poll_thread.join(timeout=2)
         # Now safe to tear down sockets and context
         self._ctx.destroy(linger=0)
         try:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 from pathlib import Path
 from typing import Optional, Union
 
@@ -192,8 +193,6 @@ def _launch_bridged_sidecar(
             "Or use 'jupyter console' instead of 'ipython'."
         ) from None
 
-    import sys
-
     ip = get_ipython()  # type: ignore[name-defined]  # noqa: F821
     bridge = install_bridge(ip)
 
@@ -16,6 +16,13 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: marks tests as slow running"
     )
+    config.addinivalue_line(
+        "markers",
+        "uses_pool(kind): test needs the daemon's prewarmed 'uv' or 'conda' pool",
+    )
+    config.addinivalue_line(
+        "markers", "doc_only: test only touches the document and never starts a kernel"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -4,10 +4,16 @@ These tests don't require a running daemon - they test construction,
 properties, and error handling for disconnected sessions.
 """
 
+import re
+import sys
+
 import pytest
 
 import runtimed
 
+# Error raised by methods that need a daemon connection
+_NOT_CONNECTED = re.compile(r"[Nn]ot connected")
+
 
 class TestSessionConstruction:
     """Test Session construction and properties."""
@@ -47,6 +53,16 @@ class TestSessionConstruction:
         session = runtimed.Session()
         assert not session.kernel_started
 
+    def test_session_prewarm_without_daemon(self, tmp_path, monkeypatch):
+        """A prewarm that can't reach the daemon settles without a kernel."""
+        monkeypatch.setenv("RUNTIMED_SOCKET_PATH", str(tmp_path / "missing.sock"))
+        session = runtimed.Session(prewarm=True)
+
+        # close() waits for the background connect + launch to finish
+        session.close()
+        assert not session.is_connected
+        assert not session.kernel_started
+
     def test_session_env_source_initially_none(self):
         """env_source is None when no kernel is running."""
         session = runtimed.Session()
@@ -81,6 +97,50 @@ class TestAsyncSessionConstruction:
         assert "test-async-repr" in r
 
 
+class TestDaemonClientConstruction:
+    """Test DaemonClient construction."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a Unix socket")
+    def test_daemon_client_honors_socket_path_env(self, tmp_path, monkeypatch):
+        """DaemonClient() connects to RUNTIMED_SOCKET_PATH when it is set."""
+        import socket
+        import threading
+
+        socket_path = tmp_path / "runtimed.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(socket_path))
+        server.listen(1)
+        server.settimeout(5)
+        accepted = []
+
+        def accept_once():
+            conn, _ = server.accept()
+            accepted.append(True)
+            conn.close()  # No reply, so the ping fails fast
+
+        thread = threading.Thread(target=accept_once)
+        thread.start()
+        try:
+            monkeypatch.setenv("RUNTIMED_SOCKET_PATH", str(socket_path))
+            client = runtimed.DaemonClient()
+            assert not client.ping()
+        finally:
+            thread.join(timeout=5)
+            server.close()
+
+        assert accepted, "DaemonClient did not connect to RUNTIMED_SOCKET_PATH"
+
+
+class TestSocketPath:
+    """Test socket path resolution."""
+
+    def test_default_socket_path_honors_env(self, tmp_path, monkeypatch):
+        """default_socket_path() returns RUNTIMED_SOCKET_PATH when it is set."""
+        socket_path = tmp_path / "runtimed.sock"
+        monkeypatch.setenv("RUNTIMED_SOCKET_PATH", str(socket_path))
+        assert runtimed.default_socket_path() == socket_path
+
+
 class TestAsyncSessionProperties:
     """Test AsyncSession async property methods."""
 
@@ -103,155 +163,78 @@ class TestAsyncSessionProperties:
         assert await session.env_source() is None
 
 
-class TestSessionErrorHandling:
-    """Test error handling for disconnected sessions."""
+# Methods that need a daemon connection, with placeholder arguments
+_CONNECTED_METHODS = [
+    ("set_source", ("cell-123", "x = 1")),
+    ("get_cell", ("cell-123",)),
+    ("get_cells", ()),
+    ("delete_cell", ("cell-123",)),
+    ("interrupt", ()),
+    ("shutdown_kernel", ()),
+    ("queue_cell", ("cell-123",)),
+]
+
+_EXPORTS = [
+    "Session",
+    "AsyncSession",
+    "DaemonClient",
+    "ExecutionResult",
+    "Output",
+    "RuntimedError",
+    "default_socket_path",
+]
 
-    def test_set_source_without_connection(self):
-        """set_source raises error when not connected."""
-        session = runtimed.Session()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            session.set_source("cell-123", "x = 1")
 
-    def test_get_cell_without_connection(self):
-        """get_cell raises error when not connected."""
-        session = runtimed.Session()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            session.get_cell("cell-123")
-
-    def test_get_cells_without_connection(self):
-        """get_cells raises error when not connected."""
-        session = runtimed.Session()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            session.get_cells()
-
-    def test_delete_cell_without_connection(self):
-        """delete_cell raises error when not connected."""
-        session = runtimed.Session()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            session.delete_cell("cell-123")
-
-    def test_interrupt_without_connection(self):
-        """interrupt raises error when not connected."""
-        session = runtimed.Session()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            session.interrupt()
+class TestSessionErrorHandling:
+    """Test error handling for disconnected sessions."""
 
-    def test_shutdown_kernel_without_connection(self):
-        """shutdown_kernel raises error when not connected."""
+    @pytest.mark.parametrize(
+        "method, args", _CONNECTED_METHODS, ids=[m for m, _ in _CONNECTED_METHODS]
+    )
+    def test_without_connection(self, method, args):
+        """Methods that need the daemon raise error when not connected."""
         session = runtimed.Session()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            session.shutdown_kernel()
+        with pytest.raises(runtimed.RuntimedError, match=_NOT_CONNECTED):
+            getattr(session, method)(*args)
 
-    def test_queue_cell_without_connection(self):
-        """queue_cell raises error when not connected."""
+    def test_execute_cells_rejects_duplicate_ids(self):
+        """execute_cells() refuses a cell ID listed twice instead of hanging."""
         session = runtimed.Session()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            session.queue_cell("cell-123")
+        with pytest.raises(runtimed.RuntimedError, match="more than once"):
+            session.execute_cells(["cell-123", "cell-123"])
 
 
 class TestAsyncSessionErrorHandling:
     """Test error handling for disconnected async sessions."""
 
     @pytest.mark.asyncio
-    async def test_async_set_source_without_connection(self):
-        """set_source raises error when not connected."""
+    @pytest.mark.parametrize(
+        "method, args",
+        _CONNECTED_METHODS + [("create_cell", ("x = 1",))],
+        ids=[m for m, _ in _CONNECTED_METHODS] + ["create_cell"],
+    )
+    async def test_async_without_connection(self, method, args):
+        """Methods that need the daemon raise error when not connected."""
         session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.set_source("cell-123", "x = 1")
+        with pytest.raises(runtimed.RuntimedError, match=_NOT_CONNECTED):
+            await getattr(session, method)(*args)
 
     @pytest.mark.asyncio
-    async def test_async_get_cell_without_connection(self):
-        """get_cell raises error when not connected."""
+    async def test_async_execute_cells_rejects_duplicate_ids(self):
+        """execute_cells() refuses a cell ID listed twice instead of hanging."""
         session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.get_cell("cell-123")
-
-    @pytest.mark.asyncio
-    async def test_async_get_cells_without_connection(self):
-        """get_cells raises error when not connected."""
-        session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.get_cells()
-
-    @pytest.mark.asyncio
-    async def test_async_delete_cell_without_connection(self):
-        """delete_cell raises error when not connected."""
-        session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.delete_cell("cell-123")
-
-    @pytest.mark.asyncio
-    async def test_async_interrupt_without_connection(self):
-        """interrupt raises error when not connected."""
-        session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.interrupt()
-
-    @pytest.mark.asyncio
-    async def test_async_shutdown_kernel_without_connection(self):
-        """shutdown_kernel raises error when not connected."""
-        session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.shutdown_kernel()
-
-    @pytest.mark.asyncio
-    async def test_async_create_cell_without_connection(self):
-        """create_cell raises error when not connected."""
-        session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.create_cell("x = 1")
-
-    @pytest.mark.asyncio
-    async def test_async_queue_cell_without_connection(self):
-        """queue_cell raises error when not connected."""
-        session = runtimed.AsyncSession()
-        with pytest.raises(runtimed.RuntimedError, match="[Nn]ot connected"):
-            await session.queue_cell("cell-123")
-
-
-class TestOutputTypes:
-    """Test Output and ExecutionResult classes."""
-
-    def test_output_class_exists(self):
-        """Output class is exported."""
-        assert hasattr(runtimed, "Output")
-
-    def test_execution_result_class_exists(self):
-        """ExecutionResult class is exported."""
-        assert hasattr(runtimed, "ExecutionResult")
-
-    def test_runtimed_error_class_exists(self):
-        """RuntimedError class is exported."""
-        assert hasattr(runtimed, "RuntimedError")
+        with pytest.raises(runtimed.RuntimedError, match="more than once"):
+            await session.execute_cells(["cell-123", "cell-123"])
 
 
 class TestModuleExports:
     """Test that all expected classes are exported."""
 
-    def test_session_exported(self):
-        """Session is exported from runtimed."""
-        assert hasattr(runtimed, "Session")
-
-    def test_async_session_exported(self):
-        """AsyncSession is exported from runtimed."""
-        assert hasattr(runtimed, "AsyncSession")
-
-    def test_daemon_client_exported(self):
-        """DaemonClient is exported from runtimed."""
-        assert hasattr(runtimed, "DaemonClient")
-
-    def test_all_exports(self):
-        """Check __all__ exports the expected items."""
-        expected = [
-            "Session",
-            "AsyncSession",
-            "DaemonClient",
-            "ExecutionResult",
-            "Output",
-            "RuntimedError",
-        ]
-        for name in expected:
-            assert name in runtimed.__all__, f"{name} not in __all__"
+    @pytest.mark.parametrize("name", _EXPORTS)
+    def test_exported(self, name):
+        """Each public class is importable and listed in __all__."""
+        assert hasattr(runtimed, name)
+        assert name in runtimed.__all__, f"{name} not in __all__"
 
 
 if __name__ == "__main__":
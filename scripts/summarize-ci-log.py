@@ -12,13 +12,30 @@ Usage:
 """
 
 import argparse
+import hashlib
+import io
 import re
 import sys
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import TextIO
 
 
 # ANSI escape code pattern
-ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+ANSI_PATTERN = re.compile(rb'\x1b\[[0-9;]*m')
+
+# GitHub Actions timestamp prefix, e.g. 2026-02-17T00:32:49.7471217Z, at the
+# start of any line. [^\S\n] is \s minus newline, so it stays on its own line.
+TIMESTAMP_PATTERN = re.compile(
+    rb'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z[^\S\n]*', re.MULTILINE
+)
+
+NEWLINE_PATTERN = re.compile(rb'\n')
+
+# Line breaks recognized by bytes.splitlines()
+LINE_BREAK_PATTERN = re.compile(rb'\r\n|\r|\n')
 
 # Error patterns that indicate failures
 ERROR_PATTERNS = [
@@ -26,13 +43,10 @@ ERROR_PATTERNS = [
     r'^error(\[E\d+\])?:',
     r'^\s*-->\s+\S+:\d+:\d+',  # Rust file:line:col references
     # Generic errors
-    r'##\[error\]',
     r'\bError\b.*failed',
     r'\bFAILED\b',
     r'failed to\b',
     r'error:.*could not compile',
-    # npm errors
-    r'npm ERR!',
     # pytest errors
     r'^FAILED\s+',
     r'^ERROR\s+',
@@ -43,6 +57,12 @@ ERROR_PATTERNS = [
     r'Process completed with exit code [1-9]',
 ]
 
+# Error markers that are plain text, found with bytes.find instead of re
+ERROR_LITERALS = [
+    '##[error]',
+    'npm ERR!',  # npm errors
+]
+
 # Warning patterns (optional inclusion)
 WARNING_PATTERNS = [
     r'^warning(\[W\d+\])?:',
@@ -70,171 +90,295 @@ NOISE_PATTERNS = [
 ]
 
 
-def strip_ansi(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    return ANSI_PATTERN.sub('', text)
+def combine_patterns(patterns: list[str]) -> re.Pattern[bytes]:
+    """Compile a pattern list into one bytes alternation, so text is scanned once.
 
+    MULTILINE lets ^ anchor at every line when searching a whole buffer.
+    """
+    return re.compile('|'.join(f'(?:{p})' for p in patterns).encode(), re.MULTILINE)
 
-def strip_timestamp(line: str) -> str:
-    """Remove GitHub Actions timestamp prefix from line."""
-    # Format: 2026-02-17T00:32:49.7471217Z
-    timestamp_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z\s*'
-    return re.sub(timestamp_pattern, '', line)
 
+def fold_case(pattern: str) -> str:
+    """Lowercase a pattern's literal characters, leaving escapes like \\S alone.
 
-def is_error_line(line: str) -> bool:
-    """Check if line matches any error pattern."""
-    clean_line = strip_timestamp(strip_ansi(line))
-    return any(re.search(p, clean_line, re.IGNORECASE) for p in ERROR_PATTERNS)
+    Searching ASCII-lowercased text with the folded pattern matches exactly
+    what the original would with bytes IGNORECASE, but keeps re's
+    case-sensitive fast paths.
+    """
+    folded = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            folded.append(pattern[i:i + 2])
+            i += 2
+        else:
+            folded.append(pattern[i].lower())
+            i += 1
+    return ''.join(folded)
 
 
-def is_warning_line(line: str) -> bool:
-    """Check if line matches any warning pattern."""
-    clean_line = strip_timestamp(strip_ansi(line))
-    return any(re.search(p, clean_line, re.IGNORECASE) for p in WARNING_PATTERNS)
+# Case-insensitive categories, matched against text.lower()
+ERROR_RE = combine_patterns([fold_case(p) for p in ERROR_PATTERNS])
+FOLDED_ERROR_LITERALS = [literal.lower().encode() for literal in ERROR_LITERALS]
+WARNING_RE = combine_patterns([fold_case(p) for p in WARNING_PATTERNS])
+CONTEXT_RE = combine_patterns(CONTEXT_PATTERNS)
+NOISE_RE = combine_patterns(NOISE_PATTERNS)
 
 
-def is_context_line(line: str) -> bool:
-    """Check if line is a context marker (group start/end)."""
-    clean_line = strip_timestamp(strip_ansi(line))
-    return any(re.search(p, clean_line) for p in CONTEXT_PATTERNS)
+def join_lines(content: bytes) -> bytes:
+    """Normalize every line break to a newline and drop the trailing one.
+
+    Holds the same lines as content.splitlines(), kept in a single buffer.
+    """
+    text = LINE_BREAK_PATTERN.sub(b'\n', content)
+    return text[:-1] if text.endswith(b'\n') else text
+
+
+def clean_text(text: bytes) -> bytes:
+    """Strip ANSI codes and timestamp prefixes from a newline-joined buffer.
+
+    The result has exactly one line per input line, ready to classify.
+    """
+    return TIMESTAMP_PATTERN.sub(b'', ANSI_PATTERN.sub(b'', text))
+
 
+def find_line_starts(text: bytes) -> list[int]:
+    """Return the offset of each line in a newline-joined buffer."""
+    return [0] + [m.end() for m in NEWLINE_PATTERN.finditer(text)]
 
-def is_noise_line(line: str) -> bool:
-    """Check if line is noise that should be filtered."""
-    clean_line = strip_timestamp(strip_ansi(line))
-    return any(re.search(p, clean_line) for p in NOISE_PATTERNS)
 
+def line_at(text: bytes, line_starts: list[int], i: int) -> bytes:
+    """Slice line i out of a newline-joined buffer."""
+    end = line_starts[i + 1] - 1 if i + 1 < len(line_starts) else len(text)
+    return text[line_starts[i]:end]
+
+
+def matching_lines(pattern: re.Pattern[bytes], text: bytes, line_starts: list[int]) -> list[int]:
+    """Return the indices of lines in a newline-joined buffer that pattern matches.
+
+    The regex engine scans the buffer directly, so only matching lines cost a
+    Python iteration. Each search resumes at the line after the last hit, and
+    a hit that runs across a newline (e.g. via \\s) is rechecked against its
+    own line, so the result is the same as searching line by line.
+    """
+    hits: list[int] = []
+    pos = 0
+    while (m := pattern.search(text, pos)) is not None:
+        i = bisect_right(line_starts, m.start()) - 1
+        next_start = line_starts[i + 1] if i + 1 < len(line_starts) else len(text) + 1
+        if m.end() < next_start or pattern.search(line_at(text, line_starts, i)):
+            hits.append(i)
+        if next_start > len(text):
+            break
+        pos = next_start
+    return hits
+
+
+def is_context_line(clean: bytes) -> bool:
+    """Check if a cleaned line is a context marker (group start/end)."""
+    return CONTEXT_RE.search(clean) is not None
+
+
+def is_noise_line(clean: bytes) -> bool:
+    """Check if a cleaned line is noise that should be filtered."""
+    return NOISE_RE.search(clean) is not None
+
+
+def find_marker_lines(text: bytes, line_starts: list[int], marker: bytes) -> list[int]:
+    """Return the indices of lines in a newline-joined buffer that contain marker.
+
+    Uses bytes.find, so the scan between markers runs at memchr speed.
+    """
+    hits: list[int] = []
+    pos = text.find(marker)
+    while pos != -1:
+        i = bisect_right(line_starts, pos) - 1
+        hits.append(i)
+        # One hit per line is enough; continue from the next line
+        if i + 1 == len(line_starts):
+            break
+        pos = text.find(marker, line_starts[i + 1])
+    return hits
 
-def find_enclosing_group(lines: list[str], error_idx: int) -> tuple[int | None, int | None]:
-    """Find the ##[group]...##[endgroup] range containing an error line."""
+
+def find_enclosing_group(group_lines: list[int], endgroup_lines: list[int],
+                         error_idx: int) -> tuple[int | None, int | None]:
+    """Find the ##[group]...##[endgroup] range containing an error line.
+
+    group_lines and endgroup_lines are the sorted lines holding each marker.
+    The nearest ##[group] at or above the line counts unless an ##[endgroup]
+    sits between them (the line belongs to a different group), and likewise
+    for the nearest ##[endgroup] at or below it.
+    """
     group_start = None
     group_end = None
+    # Markers before g / e are above the line (a ##[group] on it counts as above,
+    # an ##[endgroup] on it as below)
+    g = bisect_right(group_lines, error_idx)
+    e = bisect_left(endgroup_lines, error_idx)
 
     # Search backwards for ##[group]
-    for i in range(error_idx, -1, -1):
-        clean = strip_timestamp(strip_ansi(lines[i]))
-        if '##[group]' in clean:
-            group_start = i
-            break
-        if '##[endgroup]' in clean and i != error_idx:
-            break  # Hit a different group's end
+    if g and (not e or group_lines[g - 1] >= endgroup_lines[e - 1]):
+        group_start = group_lines[g - 1]
 
     # Search forwards for ##[endgroup]
-    for i in range(error_idx, len(lines)):
-        clean = strip_timestamp(strip_ansi(lines[i]))
-        if '##[endgroup]' in clean:
-            group_end = i
-            break
-        if '##[group]' in clean and i != error_idx:
-            break  # Hit a different group's start
+    if e < len(endgroup_lines) and (
+        g == len(group_lines) or endgroup_lines[e] <= group_lines[g]
+    ):
+        group_end = endgroup_lines[e]
 
     return group_start, group_end
 
 
-def summarize_log(content: str, context_lines: int = 3, include_warnings: bool = False) -> str:
+def summarize_log(content: bytes, context_lines: int = 3, include_warnings: bool = False) -> str:
     """
     Summarize a CI log by extracting errors and context.
 
     Args:
-        content: Full log content
+        content: Full log content, as raw bytes (decoded only for output)
         context_lines: Number of lines to include before/after errors
         include_warnings: Whether to include warning lines
 
     Returns:
         Summarized log content
     """
-    lines = content.splitlines()
+    out = io.StringIO()
+    write_summary(content, out, context_lines, include_warnings)
+    return out.getvalue()
+
+
+def write_summary(content: bytes, out: TextIO, context_lines: int = 3,
+                  include_warnings: bool = False) -> tuple[int, int]:
+    """
+    Write the summary of a CI log to out line by line (see summarize_log).
+
+    Returns:
+        Number of lines in the log and number of lines written
+    """
+    if not content:
+        out.write("No errors found in log.\n")
+        return 0, 1
+
+    # Lines stay in one buffer and are only sliced out for output
+    text = join_lines(content)
+    text_starts = find_line_starts(text)
+    num_lines = len(text_starts)
+
+    # Classify from one cleaned buffer; output keeps the original timestamps
+    cleaned = clean_text(text)
+    line_starts = find_line_starts(cleaned)
+
+    # Mark which line indices to include; 1 = keep
+    include = bytearray(num_lines)
 
-    # Track which line indices to include
-    include_ranges: list[tuple[int, int]] = []
+    def mark(start: int, end: int) -> None:
+        include[start:end] = b'\x01' * (end - start)
 
     # Always include header (first few lines before === LOGS ===)
-    header_end = 0
-    for i, line in enumerate(lines):
-        if '=== LOGS' in line:
-            header_end = i + 1
-            break
+    logs_pos = text.find(b'=== LOGS')
+    header_end = bisect_right(text_starts, logs_pos) if logs_pos >= 0 else 0
     if header_end > 0:
-        include_ranges.append((0, header_end))
-
-    # Find all error lines and their context
-    for i, line in enumerate(lines):
-        if is_error_line(line):
-            # Include context around error
-            start = max(0, i - context_lines)
-            end = min(len(lines), i + context_lines + 1)
-            include_ranges.append((start, end))
-
-            # Also include enclosing group markers
-            group_start, group_end = find_enclosing_group(lines, i)
-            if group_start is not None:
-                # Just the group header line
-                include_ranges.append((group_start, group_start + 1))
-            if group_end is not None:
-                include_ranges.append((group_end, group_end + 1))
-
-        elif include_warnings and is_warning_line(line):
-            start = max(0, i - context_lines)
-            end = min(len(lines), i + context_lines + 1)
-            include_ranges.append((start, end))
-
-    # Merge overlapping ranges
-    if not include_ranges:
-        return "No errors found in log.\n"
-
-    include_ranges.sort()
-    merged: list[tuple[int, int]] = [include_ranges[0]]
-    for start, end in include_ranges[1:]:
-        if start <= merged[-1][1]:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-        else:
-            merged.append((start, end))
+        mark(0, header_end)
 
-    # Build output
-    output_lines: list[str] = []
-    last_end = 0
+    # Errors and warnings are case-insensitive; see fold_case
+    folded = cleaned.lower()
+    error_lines = set(matching_lines(ERROR_RE, folded, line_starts))
+    for literal in FOLDED_ERROR_LITERALS:
+        error_lines.update(find_marker_lines(folded, line_starts, literal))
+    if error_lines:
+        group_lines = find_marker_lines(cleaned, line_starts, b'##[group]')
+        endgroup_lines = find_marker_lines(cleaned, line_starts, b'##[endgroup]')
 
-    for start, end in merged:
-        # Add separator if there's a gap
-        if output_lines and start > last_end:
-            output_lines.append("...")
+    # Find all error lines and their context
+    for i in error_lines:
+        # Include context around error
+        mark(max(0, i - context_lines), min(num_lines, i + context_lines + 1))
+
+        # Also include enclosing group markers
+        group_start, group_end = find_enclosing_group(group_lines, endgroup_lines, i)
+        if group_start is not None:
+            # Just the group header line
+            include[group_start] = 1
+        if group_end is not None:
+            include[group_end] = 1
+
+    if include_warnings:
+        # Error lines already carry their context
+        for i in matching_lines(WARNING_RE, folded, line_starts):
+            if i not in error_lines:
+                mark(max(0, i - context_lines), min(num_lines, i + context_lines + 1))
+
+    if 1 not in include:
+        out.write("No errors found in log.\n")
+        return num_lines, 1
+
+    # Write each run of included lines
+    written = 0
+    strip_ansi = ANSI_PATTERN.sub
+    start = include.find(1)
+
+    while start != -1:
+        end = include.find(0, start)
+        if end == -1:
+            end = len(include)
+
+        # Add separator for the gap before this run
+        if written:
+            out.write("...\n")
+            written += 1
 
         for i in range(start, end):
-            line = lines[i]
             # Skip noise lines unless they're in the header
-            if start >= header_end and is_noise_line(line):
+            if start >= header_end and is_noise_line(line_at(cleaned, line_starts, i)):
                 continue
 
             # Strip ANSI codes for cleaner output
-            clean_line = strip_ansi(line)
-            output_lines.append(clean_line)
+            out.write(strip_ansi(b'', line_at(text, text_starts, i)).decode('utf-8', errors='replace'))
+            out.write('\n')
+            written += 1
+
+        start = include.find(1, end)
+
+    if not written:
+        # Every included line was noise
+        out.write('\n')
+        return num_lines, 1
+    return num_lines, written
 
-        last_end = end
 
-    return '\n'.join(output_lines) + '\n'
+def log_digest(input_path: Path) -> bytes:
+    """Hash a log file's raw content, to spot copies of the same log."""
+    return hashlib.blake2b(input_path.read_bytes(), digest_size=16).digest()
+
+
+def summarize_file(input_path: Path, context_lines: int, include_warnings: bool) -> str:
+    """Summarize a single log file (see summarize_log)."""
+    return summarize_log(input_path.read_bytes(), context_lines, include_warnings)
+
+
+def stdout_report(input_path: Path, summary: str) -> str:
+    """Format a summary for --stdout, under a header naming its file."""
+    return f"=== {input_path.name} ===\n{summary}\n"
 
 
 def process_file(input_path: Path, output_path: Path | None,
                  context_lines: int, include_warnings: bool,
-                 to_stdout: bool) -> None:
-    """Process a single log file."""
-    content = input_path.read_text(encoding='utf-8', errors='replace')
-    summary = summarize_log(content, context_lines, include_warnings)
-
+                 to_stdout: bool) -> str:
+    """Process a single log file, returning what to print for it."""
     if to_stdout:
-        print(f"=== {input_path.name} ===")
-        print(summary)
+        summary = summarize_file(input_path, context_lines, include_warnings)
+        return stdout_report(input_path, summary)
     else:
+        content = input_path.read_bytes()
         if output_path is None:
             output_path = input_path.with_suffix(input_path.suffix + '.summary')
-        output_path.write_text(summary, encoding='utf-8')
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            original_lines, summary_lines = write_summary(content, f, context_lines,
+                                                          include_warnings)
 
         # Report size reduction
-        original_lines = len(content.splitlines())
-        summary_lines = len(summary.splitlines())
         reduction = (1 - summary_lines / original_lines) * 100 if original_lines > 0 else 0
-        print(f"{input_path.name}: {original_lines} -> {summary_lines} lines ({reduction:.0f}% reduction)")
+        return f"{input_path.name}: {original_lines} -> {summary_lines} lines ({reduction:.0f}% reduction)\n"
 
 
 def main():
@@ -258,14 +402,37 @@ def main():
     if args.output and len(args.files) > 1:
         parser.error("--output can only be used with a single input file")
 
+    input_paths = []
     for input_path in args.files:
         if not input_path.exists():
             print(f"Warning: {input_path} does not exist, skipping", file=sys.stderr)
             continue
-
+        input_paths.append(input_path)
+
+    if len(input_paths) > 1 and args.stdout:
+        # Copies of the same log (e.g. a job log downloaded twice) are
+        # summarized once, keyed by a hash of their content
+        digests = [log_digest(input_path) for input_path in input_paths]
+        unique_paths = dict(zip(digests, input_paths))
+        with ProcessPoolExecutor() as pool:
+            summaries = dict(zip(unique_paths, pool.map(
+                summarize_file, unique_paths.values(),
+                repeat(args.context), repeat(args.include_warnings))))
+        for input_path, digest in zip(input_paths, digests):
+            sys.stdout.write(stdout_report(input_path, summaries[digest]))
+    elif len(input_paths) > 1:
+        # Files are independent, so summarize them in parallel; map() keeps
+        # the reports in argument order
+        with ProcessPoolExecutor() as pool:
+            for report in pool.map(process_file, input_paths, repeat(None),
+                                   repeat(args.context), repeat(args.include_warnings),
+                                   repeat(args.stdout)):
+                sys.stdout.write(report)
+    else:
         output_path = args.output if len(args.files) == 1 else None
-        process_file(input_path, output_path, args.context,
-                     args.include_warnings, args.stdout)
+        for input_path in input_paths:
+            sys.stdout.write(process_file(input_path, output_path, args.context,
+                                          args.include_warnings, args.stdout))
 
 
 if __name__ == '__main__':